@@ -9,7 +9,14 @@ import time
 import tkinter as tk
 from collections import deque
 from ctypes import wintypes
+from operator import itemgetter
 from pathlib import Path
+from tkinter import font as tkfont
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import (
     BOT_ARCHETYPES,
@@ -35,13 +42,37 @@ from .config import (
     PLAYER_RADIUS,
     RAY_DENSITY,
     SENSITIVITY_STEP,
-    WEAPON_DATA,
+    TARGET_FPS,
+    WEAPON_AMMO_PACK,
+    WEAPON_COST,
+    WEAPON_DAMAGE,
+    WEAPON_FIRE_RATE,
+    WEAPON_ID,
+    WEAPON_INFINITE,
+    WEAPON_MAG_SIZE,
+    WEAPON_NAME,
     WEAPON_ORDER,
+    WEAPON_PELLETS,
+    WEAPON_RANGE,
+    WEAPON_RECOIL_SCALE,
+    WEAPON_RELOAD_TIME,
+    WEAPON_SPREAD,
+    WEAPON_SPREAD_GROWTH,
     WORLD_MAP,
 )
-from .models import Bot, MoneyDrop, PauseHitbox, RemotePlayer, TeammateView, make_ammo, make_owned_weapons
+from .models import (
+    Bot,
+    DirtyDict,
+    MoneyDrop,
+    PauseHitbox,
+    RemoteInterpTarget,
+    RemotePlayer,
+    TeammateView,
+    make_ammo,
+    make_owned_weapons,
+)
 from .network import CoopClient, CoopHostServer
-from .utils import clamp, distance, normalize_angle, rgb
+from .utils import clamp, distance, distance_sq, normalize_angle, rgb
 
 HAS_WIN32 = hasattr(ctypes, "windll") and hasattr(ctypes.windll, "user32")
 HAS_MACOS = sys.platform == "darwin"
@@ -52,6 +83,19 @@ MOUSE_WARP_INTERVAL_SECONDS = 1.0 / 90.0
 
 SETTINGS_FILE_PATH = Path.home() / ".fps_bot_arena_settings.json"
 PROFILE_FILE_PATH = Path.home() / ".fps_bot_arena_profile.json"
+PROFILE_SAVE_INTERVAL_SECONDS = 1.0
+
+
+def _json_loads(raw: str) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dump_bytes(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
 
 HAS_MACOS_CURSOR_WARP = False
 _macos_app_services = None
@@ -81,6 +125,117 @@ RECOIL_PATTERNS = {
     "rpg": [0.0],
 }
 
+# Flat view of RECOIL_PATTERNS indexed by WEAPON_ID for the fire hot path.
+RECOIL_TABLE = tuple(tuple(RECOIL_PATTERNS.get(weapon, [0.0])) for weapon in WEAPON_ORDER)
+
+# Tracked keysyms and their slots in the keys_state bytearray; an indexed
+# byte load is cheaper than set hashing in the per-frame movement checks.
+KEY_IDS = {
+    "w": 0,
+    "a": 1,
+    "s": 2,
+    "d": 3,
+    "shift_l": 4,
+    "shift_r": 5,
+    "left": 6,
+    "right": 7,
+    "e": 8,
+    "r": 9,
+    "q": 10,
+    "tab": 11,
+}
+# Keys that travel over the co-op wire, in KEY_IDS slot order so a pressed
+# key's bit on the wire is 1 << its keys_state index.
+WIRE_KEYS = ("w", "a", "s", "d", "shift_l", "shift_r", "left", "right", "e", "r", "q")
+
+KEY_W = KEY_IDS["w"]
+KEY_A = KEY_IDS["a"]
+KEY_S = KEY_IDS["s"]
+KEY_D = KEY_IDS["d"]
+KEY_SHIFT_L = KEY_IDS["shift_l"]
+KEY_SHIFT_R = KEY_IDS["shift_r"]
+KEY_LEFT = KEY_IDS["left"]
+KEY_RIGHT = KEY_IDS["right"]
+KEY_E = KEY_IDS["e"]
+KEY_TAB = KEY_IDS["tab"]
+
+# Keystate bits for remote players: the wire bitmask is kept as-is on the
+# host, so movement checks are one mask-and instead of a string-set probe.
+KEYBIT_W = 1 << KEY_W
+KEYBIT_A = 1 << KEY_A
+KEYBIT_S = 1 << KEY_S
+KEYBIT_D = 1 << KEY_D
+KEYBIT_SPRINT = (1 << KEY_SHIFT_L) | (1 << KEY_SHIFT_R)
+KEYBIT_LEFT = 1 << KEY_LEFT
+KEYBIT_RIGHT = 1 << KEY_RIGHT
+KEYBIT_E = 1 << KEY_E
+KEYBIT_Q = 1 << KEY_IDS["q"]
+KEYBIT_MOVE = KEYBIT_W | KEYBIT_A | KEYBIT_S | KEYBIT_D
+# All wire-visible key bits; the local mask also tracks non-wire keys.
+WIRE_KEY_MASK = (1 << len(WIRE_KEYS)) - 1
+
+# Per-kind sprite scale and body color, resolved with one dict lookup per
+# visible bot instead of an if/elif chain per frame.
+BOT_VISUAL = {
+    "grunt": (1.0, "#d64a4a"),
+    "flanker": (0.92, "#dc8750"),
+    "tank": (1.18, "#7b5ad0"),
+    "sharpshooter": (1.0, "#49a2d6"),
+    "boss": (1.34, "#f04d9d"),
+}
+BOT_COVER_COLOR = "#c28a3e"
+
+# Sprite LOD tiers: below SPRITE_LOD_BODY_H pixels the head and health bar
+# are sub-pixel detail and the body rectangle is drawn alone; below
+# SPRITE_LOD_DOT_H the whole sprite collapses to a 2px sliver. Name labels
+# drop out past SPRITE_LABEL_MAX_DIST world units.
+# Muzzle tip offset inside the viewmodel group, per weapon.
+_VIEWMODEL_MUZZLE = {
+    "pistol": (280, 73),
+    "shotgun": (318, 68),
+    "rifle": (328, 72),
+    "rpg": (378, 87),
+}
+
+# Full-screen 50%-dim overlay tints, one cached checkerboard image each.
+_OVERLAY_COLORS = {
+    "scoreboard": "#05070d",
+    "pause": "#050810",
+    "shop": "#060b14",
+    "glitch": "#091327",
+    "dead": "#2a0000",
+}
+
+SPRITE_LOD_BODY_H = 16
+SPRITE_LOD_DOT_H = 8
+SPRITE_LABEL_MAX_DIST = 25.0
+
+# Bounds for the adaptive per-frame sprite budget: when frames run over
+# the FPS budget the farthest sprites are shed first, never below the
+# floor so nearby threats always draw.
+SPRITE_BUDGET_MIN = 24
+SPRITE_BUDGET_MAX = 200
+
+# Pre-jittered effect geometry: several randomized "phases" of the
+# muzzle-flash ray fan (unit endpoint offsets, length jitter baked in) and
+# of the glitch-overlay scan lines. Picking one phase per frame with a
+# single random.choice keeps the flicker while dropping the per-element
+# random.uniform/randint and cos/sin calls from the draw loops.
+_FLASH_RAY_PHASES = tuple(
+    tuple(
+        (math.cos(ang) * length, math.sin(ang) * length)
+        for ang, length in (
+            ((math.tau / 8) * i + random.uniform(-0.18, 0.18), random.uniform(1.15, 1.65))
+            for i in range(8)
+        )
+    )
+    for _ in range(16)
+)
+_GLITCH_LINE_PHASES = tuple(
+    tuple((random.random(), random.randint(-80, 80), random.randint(-8, 8)) for _ in range(18))
+    for _ in range(16)
+)
+
 class FPSBotArena:
     def __init__(
         self,
@@ -101,17 +256,21 @@ class FPSBotArena:
         self.client_connected = mode != "client"
         self.last_net_send = 0.0
         self.net_send_interval = 1.0 / 30.0
+        self._last_snapshot_ts = 0.0
         self.net_status = ""
         self._init_network(mode, connect_host, port, player_name)
         self._configure_window(self._build_window_title(mode))
         self._init_input_and_settings_state()
 
-        self.last_time = time.perf_counter()
+        self.last_time_ns = time.perf_counter_ns()
         self.damage_flash = 0.0
         self.muzzle_flash_timer = 0.0
         self.weapon_kick = 0.0
 
+        self._build_world_grid()
         self._build_floor_cells()
+        self._build_floor_components()
+        self._build_spawnable_centers()
         self._build_cover_points()
         self.reset_game()
         self._bind_events()
@@ -157,11 +316,22 @@ class FPSBotArena:
         self.root.resizable(False, False)
         self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg="#101012", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
+        # Shared tkfont.Font handles keyed by (size, bold): handing Tk the
+        # same Font object skips re-parsing a ("Consolas", N, "bold") tuple
+        # on every create_text call.
+        self._fonts: dict[tuple[int, bool], tkfont.Font] = {}
+        # Tcl widget path of the canvas, for batched item creation scripts.
+        self._canvas_path = str(self.canvas)
 
     def _init_input_and_settings_state(self) -> None:
         self.settings_path = SETTINGS_FILE_PATH
         self.profile_path = PROFILE_FILE_PATH
-        self.keys: set[str] = set()
+        self._profile_dirty = False
+        self._last_profile_save = 0.0
+        self.keys_state = bytearray(len(KEY_IDS))
+        # Bitmask mirror of keys_state, maintained at key events so hot
+        # paths test several keys with one mask-and.
+        self.local_keymask = 0
         self.mouse_down = False
         self.last_mouse_x = WIDTH // 2
         self.last_mouse_y = HALF_HEIGHT
@@ -174,11 +344,17 @@ class FPSBotArena:
         self.resolution_index = self.find_resolution_index(WIDTH, HEIGHT)
         self.pause_open = False
         self.pause_hitboxes: list[PauseHitbox] = []
+        # Pause hitboxes are a pure function of the resolution; the key
+        # records which layout the current table was built for.
+        self._pause_layout_key: tuple[int, int] | None = None
+        self._pause_hitboxes_stale = False
         self.mouse_smoothing_enabled = DEFAULT_MOUSE_SMOOTHING_ENABLED
         self.mouse_smoothing_strength = DEFAULT_MOUSE_SMOOTHING_STRENGTH
         self.smoothed_mouse_dx = 0.0
+        self._pending_mouse_dx = 0.0
         self.use_warp_mouse = HAS_WIN32 or HAS_MACOS_CURSOR_WARP
         self.next_warp_allowed_at = 0.0
+        self._last_clip_rect: tuple[int, int, int, int] | None = None
         self.last_damage_from = 0.0
         self.damage_direction_timer = 0.0
         self.team_ping: tuple[float, float, float, str] | None = None
@@ -189,19 +365,39 @@ class FPSBotArena:
         self.current_reload_weapon: str | None = None
         self.reload_end_at = 0.0
         self.spread_heat = 0.0
-        self.recoil_index = {weapon: 0 for weapon in WEAPON_ORDER}
-        self.clip = {weapon: int(WEAPON_DATA[weapon]["mag_size"]) for weapon in WEAPON_ORDER}
+        self.recoil_index = [0] * len(WEAPON_ORDER)
+        self.clip = DirtyDict({weapon: WEAPON_MAG_SIZE[WEAPON_ID[weapon]] for weapon in WEAPON_ORDER})
         self.adaptive_quality_enabled = True
         self.frame_dt_avg = 1.0 / 60.0
         self.last_quality_adjust = 0.0
         self.base_ray_target = RAY_COUNT
+        self.sprite_budget = SPRITE_BUDGET_MAX
+        self._ray_table_key: tuple[float, int] | None = None
+        self.zbuffer: list[float] = [0.0] * RAY_COUNT
+        # Persistent viewmodel group state: which weapon's silhouette is
+        # built, where the group currently sits, and whether it is hidden.
+        self._viewmodel_weapon: str | None = None
+        self._viewmodel_x = 0.0
+        self._viewmodel_y = 0.0
+        self._viewmodel_hidden = False
+        # Weapon-bar state key; None forces the first build.
+        self._wbar_key: tuple | None = None
+        # Persistent end-screen groups (BSOD, death overlay): build keys
+        # and whether each is currently shown.
+        self._bsod_key: tuple[int, int] | None = None
+        self._bsod_visible = False
+        self._dead_key: object | None = None
+        self._dead_visible = False
         self.profile_level = 1
+        self._xp_to_next = 100 + self.profile_level * 65
         self.profile_xp = 0
         self.perk_points = 0
         self.attachment_tier = 0
         self.perks = {"vitality": 0, "mobility": 0, "regen": 0, "weapon": 0}
-        self.remote_interp_targets: dict[str, tuple[float, float, float, float, str, bool, str, int, int, int, int]] = {}
+        self.remote_interp_targets: dict[str, RemoteInterpTarget] = {}
         self.remote_render_map: dict[str, TeammateView] = {}
+        self._bot_pool: list[Bot] = []
+        self._drop_pool: list[MoneyDrop] = []
         self.wave_cleared_award_pending = False
         self.sky_stars = [
             (
@@ -218,6 +414,7 @@ class FPSBotArena:
             (153, 120, 112),
             (117, 136, 120),
         ]
+        self._wall_color_cache: dict[tuple[int, int, int, int], str] = {}
 
         self.mouse_locked = True
         self.focused = True
@@ -230,10 +427,7 @@ class FPSBotArena:
     def _bind_events(self) -> None:
         self.root.bind("<KeyPress>", self.on_key_down)
         self.root.bind("<KeyRelease>", self.on_key_up)
-        self.root.bind("<Motion>", self.on_mouse_move)
-        self.root.bind("<ButtonPress-1>", self.on_mouse_down)
-        self.root.bind("<ButtonPress-2>", self.on_mouse_down)
-        self.root.bind("<ButtonPress-3>", self.on_mouse_down)
+        self.root.bind("<ButtonPress>", self.on_mouse_down)
         self.root.bind("<ButtonRelease-1>", self.on_mouse_up)
         self.root.bind("<FocusIn>", self.on_focus_in)
         self.root.bind("<FocusOut>", self.on_focus_out)
@@ -256,14 +450,14 @@ class FPSBotArena:
 
         self.owned_weapons = make_owned_weapons()
         self.ammo = make_ammo()
-        self.clip = {weapon: 0 for weapon in WEAPON_ORDER}
-        self.clip["pistol"] = int(WEAPON_DATA["pistol"]["mag_size"])
+        self.clip = DirtyDict({weapon: 0 for weapon in WEAPON_ORDER})
+        self.clip["pistol"] = WEAPON_MAG_SIZE[WEAPON_ID["pistol"]]
         self.current_weapon = "pistol"
         self.next_fire_at = 0.0
         self.current_reload_weapon = None
         self.reload_end_at = 0.0
         self.spread_heat = 0.0
-        self.recoil_index = {weapon: 0 for weapon in WEAPON_ORDER}
+        self.recoil_index = [0] * len(WEAPON_ORDER)
 
         self.shop_open = False
         self.wave = 0
@@ -275,6 +469,10 @@ class FPSBotArena:
         self.team_ping = None
 
         self.bots: list[Bot] = []
+        self._alive_bots: list[Bot] = []
+        self._bots_dirty = False
+        self._bot_grid: dict[tuple[int, int], list[Bot]] = {}
+        self._los_cache: dict[tuple[str, int], bool] = {}
         self.money_drops: list[MoneyDrop] = []
 
         self.game_state = "playing"
@@ -298,11 +496,11 @@ class FPSBotArena:
                 remote.current_weapon = "pistol"
                 remote.owned_weapons = make_owned_weapons()
                 remote.ammo = make_ammo()
-                remote.clip = {weapon: 0 for weapon in WEAPON_ORDER}
-                remote.clip["pistol"] = int(WEAPON_DATA["pistol"]["mag_size"])
+                remote.clip = DirtyDict({weapon: 0 for weapon in WEAPON_ORDER})
+                remote.clip["pistol"] = WEAPON_MAG_SIZE[WEAPON_ID["pistol"]]
                 remote.next_fire_at = 0.0
                 remote.time_since_damage = 0.0
-                remote.keys.clear()
+                remote.keymask = 0
                 remote.shooting = False
                 remote.downed = False
                 remote.bleed_out = 0.0
@@ -354,6 +552,9 @@ class FPSBotArena:
         self.base_ray_target = max(160, min(MAX_RAY_COUNT, int(WIDTH / RAY_DENSITY)))
         RAY_COUNT = self.base_ray_target
         self.canvas.configure(width=WIDTH, height=HEIGHT)
+        self._build_static_backdrop()
+        self._build_hud_chrome()
+        self._build_overlay_images()
         self.last_mouse_x = min(self.last_mouse_x, WIDTH - 1)
         self.last_mouse_y = min(self.last_mouse_y, HEIGHT - 1)
 
@@ -378,7 +579,8 @@ class FPSBotArena:
 
     def toggle_pause_menu(self) -> None:
         self.pause_open = not self.pause_open
-        self.keys.clear()
+        self.keys_state[:] = bytes(len(self.keys_state))
+        self.local_keymask = 0
         self.mouse_down = False
         if self.pause_open:
             self.shop_open = False
@@ -402,8 +604,8 @@ class FPSBotArena:
     def load_user_settings(self) -> None:
         try:
             raw = self.settings_path.read_text(encoding="utf-8")
-            payload = json.loads(raw)
-        except (OSError, json.JSONDecodeError):
+            payload = _json_loads(raw)
+        except (OSError, ValueError):
             return
 
         if not isinstance(payload, dict):
@@ -459,21 +661,22 @@ class FPSBotArena:
             "resolution": [int(width), int(height)],
         }
         try:
-            self.settings_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            self.settings_path.write_bytes(_json_dump_bytes(payload))
         except OSError:
             pass
 
     def load_profile(self) -> None:
         try:
             raw = self.profile_path.read_text(encoding="utf-8")
-            payload = json.loads(raw)
-        except (OSError, json.JSONDecodeError):
+            payload = _json_loads(raw)
+        except (OSError, ValueError):
             return
 
         if not isinstance(payload, dict):
             return
 
         self.profile_level = max(1, int(payload.get("level", self.profile_level)))
+        self._xp_to_next = 100 + self.profile_level * 65
         self.profile_xp = max(0, int(payload.get("xp", self.profile_xp)))
         self.perk_points = max(0, int(payload.get("perk_points", self.perk_points)))
         self.attachment_tier = max(0, int(payload.get("attachment_tier", self.attachment_tier)))
@@ -486,6 +689,15 @@ class FPSBotArena:
                     self.perks[key] = max(0, min(8, value))
 
     def save_profile(self) -> None:
+        # Profile saves happen on every kill; mark dirty and let the loop
+        # coalesce the actual disk write.
+        self._profile_dirty = True
+
+    def flush_profile(self, now: float, force: bool = False) -> None:
+        if not self._profile_dirty:
+            return
+        if not force and now - self._last_profile_save < PROFILE_SAVE_INTERVAL_SECONDS:
+            return
         payload = {
             "level": int(self.profile_level),
             "xp": int(self.profile_xp),
@@ -494,21 +706,24 @@ class FPSBotArena:
             "perks": dict(self.perks),
         }
         try:
-            self.profile_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            self.profile_path.write_bytes(_json_dump_bytes(payload))
         except OSError:
             pass
+        self._profile_dirty = False
+        self._last_profile_save = now
 
     def xp_to_next_level(self) -> int:
-        return 100 + self.profile_level * 65
+        return self._xp_to_next
 
     def gain_xp(self, amount: int) -> None:
         if amount <= 0:
             return
         self.profile_xp += amount
         leveled = False
-        while self.profile_xp >= self.xp_to_next_level():
-            self.profile_xp -= self.xp_to_next_level()
+        while self.profile_xp >= self._xp_to_next:
+            self.profile_xp -= self._xp_to_next
             self.profile_level += 1
+            self._xp_to_next = 100 + self.profile_level * 65
             self.perk_points += 1
             leveled = True
             if self.profile_level % 3 == 0:
@@ -546,80 +761,131 @@ class FPSBotArena:
     def get_recoil_multiplier(self) -> float:
         return max(0.65, 1.0 - self.attachment_tier * 0.025)
 
+    def _build_world_grid(self) -> None:
+        self.wall_grid: list[bytes] = [
+            bytes(1 if cell == "#" else 0 for cell in row) for row in WORLD_MAP
+        ]
+        # Bit-packed rows: wall test is one shift + mask on a small int,
+        # which beats indexing a row object in the DDA and BFS inner loops.
+        self.wall_bits: list[int] = [
+            sum(1 << x for x, cell in enumerate(row) if cell == "#") for row in WORLD_MAP
+        ]
+        self.map_h = len(WORLD_MAP)
+        self.map_w = len(WORLD_MAP[0])
+
     def _build_floor_cells(self) -> None:
-        self.floor_cells: list[tuple[int, int]] = []
-        for y, row in enumerate(WORLD_MAP):
-            for x, cell in enumerate(row):
-                if cell == ".":
-                    self.floor_cells.append((x, y))
-
-    def get_reachable_floor_cells(self) -> list[tuple[int, int]]:
-        start_x = int(self.player_x)
-        start_y = int(self.player_y)
-        if self.is_wall(start_x + 0.5, start_y + 0.5):
-            return list(self.floor_cells)
-
-        queue = deque([(start_x, start_y)])
-        visited: set[tuple[int, int]] = {(start_x, start_y)}
-        reachable: list[tuple[int, int]] = []
-
-        while queue:
-            x, y = queue.popleft()
-            reachable.append((x, y))
-            for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nx = x + ox
-                ny = y + oy
-                if (nx, ny) in visited:
-                    continue
-                if ny < 0 or ny >= len(WORLD_MAP) or nx < 0 or nx >= len(WORLD_MAP[0]):
-                    continue
-                if WORLD_MAP[ny][nx] == "#":
-                    continue
-                visited.add((nx, ny))
-                queue.append((nx, ny))
+        # Read the numeric wall bitmasks rather than re-scanning the string
+        # map; every non-wall cell is floor.
+        map_w = self.map_w
+        self.floor_cells: list[tuple[int, int]] = [
+            (x, y)
+            for y, bits in enumerate(self.wall_bits)
+            for x in range(map_w)
+            if not (bits >> x) & 1
+        ]
 
-        if not reachable:
-            return list(self.floor_cells)
-        return reachable
+    def _build_floor_components(self) -> None:
+        """Label connected floor regions once; the map never changes."""
+        self._floor_component: dict[tuple[int, int], int] = {}
+        self._component_cells: dict[int, list[tuple[int, int]]] = {}
+        component = 0
+        for cell in self.floor_cells:
+            if cell in self._floor_component:
+                continue
+            component += 1
+            self._floor_component[cell] = component
+            cells = [cell]
+            queue = deque([cell])
+            while queue:
+                x, y = queue.popleft()
+                for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    neighbor = (x + ox, y + oy)
+                    if neighbor in self._floor_component:
+                        continue
+                    nx, ny = neighbor
+                    if ny < 0 or ny >= self.map_h or nx < 0 or nx >= self.map_w:
+                        continue
+                    if (self.wall_bits[ny] >> nx) & 1:
+                        continue
+                    self._floor_component[neighbor] = component
+                    cells.append(neighbor)
+                    queue.append(neighbor)
+            self._component_cells[component] = cells
+
+    def _build_spawnable_centers(self) -> None:
+        """Cache per-component cell centers wide enough to spawn at; the
+        passability test depends only on the static map."""
+        self._spawnable_centers: dict[int, list[tuple[float, float]]] = {}
+        for component, cells in self._component_cells.items():
+            self._spawnable_centers[component] = [
+                (x + 0.5, y + 0.5) for x, y in cells if self.can_move(x + 0.5, y + 0.5, 0.24)
+            ]
+        self._all_spawnable_centers = [
+            center for centers in self._spawnable_centers.values() for center in centers
+        ]
+
+    def get_spawnable_centers(self) -> list[tuple[float, float]]:
+        """Cached spawn candidates in the player's floor component.
+
+        Both the component labelling and the passability filter depend only
+        on the static map, so wave spawns reduce to a dict lookup instead of
+        re-walking every floor cell through ``can_move``.
+        """
+        component = self._floor_component.get((int(self.player_x), int(self.player_y)))
+        if component is None:
+            return self._all_spawnable_centers
+        return self._spawnable_centers[component]
 
     def _build_cover_points(self) -> None:
+        """Floor cells flanked by at least two orthogonal walls, found in a
+        single pass over the numeric grid (out-of-bounds counts as wall)."""
+        grid = self.wall_grid
+        map_h = len(grid)
+        map_w = len(grid[0])
         self.cover_points: list[tuple[float, float]] = []
-        for x, y in self.floor_cells:
-            walls = 0
-            for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                if self.is_wall(x + ox + 0.5, y + oy + 0.5):
-                    walls += 1
-            if walls >= 2:
-                self.cover_points.append((x + 0.5, y + 0.5))
+        for y, row in enumerate(grid):
+            row_up = grid[y - 1] if y > 0 else None
+            row_down = grid[y + 1] if y + 1 < map_h else None
+            for x, cell in enumerate(row):
+                if cell:
+                    continue
+                walls = (
+                    (row[x - 1] if x > 0 else 1)
+                    + (row[x + 1] if x + 1 < map_w else 1)
+                    + (row_up[x] if row_up is not None else 1)
+                    + (row_down[x] if row_down is not None else 1)
+                )
+                if walls >= 2:
+                    self.cover_points.append((x + 0.5, y + 0.5))
 
     def pick_spawn_far_from_point(self, ref_x: float, ref_y: float, min_dist: float) -> tuple[float, float]:
-        reachable_cells = self.get_reachable_floor_cells()
-        candidates: list[tuple[float, float, float]] = []
-        for cell_x, cell_y in reachable_cells:
-            x = cell_x + 0.5
-            y = cell_y + 0.5
-            if not self.can_move(x, y, 0.24):
-                continue
-            d = distance(x, y, ref_x, ref_y)
-            candidates.append((x, y, d))
+        centers = self.get_spawnable_centers()
+        min_d2 = min_dist * min_dist
+        far: list[tuple[float, float]] = []
+        best: tuple[float, float] | None = None
+        best_d2 = -1.0
+        for center in centers:
+            dx = center[0] - ref_x
+            dy = center[1] - ref_y
+            d2 = dx * dx + dy * dy
+            if d2 >= min_d2:
+                far.append(center)
+            elif d2 > best_d2:
+                best_d2 = d2
+                best = center
 
-        if not candidates:
-            return self.player_x, self.player_y
-
-        far = [item for item in candidates if item[2] >= min_dist]
         if far:
-            x, y, _ = random.choice(far)
-            return x, y
-
-        x, y, _ = max(candidates, key=lambda item: item[2])
-        return x, y
+            return random.choice(far)
+        if best is not None:
+            return best
+        return self.player_x, self.player_y
 
     def send_client_action(self, action_type: str, weapon: str) -> None:
         if self.coop_client is None:
             return
         self.coop_client.send({"type": action_type, "weapon": weapon})
 
-    def process_host_network_events(self) -> None:
+    def process_host_network_events(self, now: float) -> None:
         if self.coop_server is None:
             return
 
@@ -635,8 +901,8 @@ class FPSBotArena:
                     y=spawn_y,
                     angle=random.uniform(0.0, math.tau),
                 )
-                remote.clip = {weapon: 0 for weapon in WEAPON_ORDER}
-                remote.clip["pistol"] = int(WEAPON_DATA["pistol"]["mag_size"])
+                remote.clip = DirtyDict({weapon: 0 for weapon in WEAPON_ORDER})
+                remote.clip["pistol"] = WEAPON_MAG_SIZE[WEAPON_ID["pistol"]]
                 self.remote_players[player_id] = remote
             elif evt == "disconnect":
                 self.remote_players.pop(player_id, None)
@@ -652,10 +918,19 @@ class FPSBotArena:
                     if name:
                         remote.name = name[:18]
                 elif msg_type == "input":
-                    allowed = {"w", "a", "s", "d", "shift_l", "shift_r", "left", "right", "e", "r", "q"}
-                    remote.keys = {k for k in message.get("keys", []) if k in allowed}
+                    mask = message.get("keys", 0)
+                    if isinstance(mask, int):
+                        remote.keymask = mask & ((1 << len(WIRE_KEYS)) - 1)
+                    # Clients echo the host timestamp of the last snapshot
+                    # they saw; both ends of the measurement are host-clock.
+                    # A non-positive ack means no snapshot received yet --
+                    # keep the prior rather than sampling a bogus worst case.
+                    ack_ts = message.get("ack_ts")
+                    if isinstance(ack_ts, (int, float)) and ack_ts > 0.0:
+                        sample_ms = min(1000.0, max(0.0, (now - ack_ts) * 1000.0))
+                        remote.rtt_ms += (sample_ms - remote.rtt_ms) * 0.2
                     try:
-                        remote.angle = normalize_angle(float(message.get("angle", remote.angle)))
+                        remote.angle = float(message.get("angle", remote.angle)) % math.tau
                     except (TypeError, ValueError):
                         pass
                     remote.shooting = bool(message.get("shoot", False))
@@ -686,49 +961,60 @@ class FPSBotArena:
                 self.apply_snapshot(message)
 
     def apply_snapshot(self, payload: dict) -> None:
-        you_id = str(payload.get("you_id", "")).strip()
+        # Builtin conversions bound as locals: LOAD_FAST instead of a
+        # global lookup for every field of every bot in the snapshot.
+        _float = float
+        _int = int
+        _bool = bool
+        _str = str
+
+        you_id = _str(payload.get("you_id", "")).strip()
         if you_id:
             self.player_id = you_id
 
+        ts = payload.get("ts")
+        if isinstance(ts, (int, float)):
+            self._last_snapshot_ts = ts
+
         you = payload.get("you", {})
-        self.player_x = float(you.get("x", self.player_x))
-        self.player_y = float(you.get("y", self.player_y))
-        self.player_angle = normalize_angle(float(you.get("angle", self.player_angle)))
-        self.player_health = float(you.get("health", self.player_health))
-        self.player_downed = bool(you.get("downed", self.player_downed))
-        self.player_money = int(you.get("money", self.player_money))
-        self.player_kills = int(you.get("kills", self.player_kills))
-        self.player_deaths = int(you.get("deaths", self.player_deaths))
-        self.player_headshots = int(you.get("headshots", self.player_headshots))
-        self.current_weapon = str(you.get("weapon", self.current_weapon))
+        self.player_x = _float(you.get("x", self.player_x))
+        self.player_y = _float(you.get("y", self.player_y))
+        self.player_angle = _float(you.get("angle", self.player_angle)) % math.tau
+        self.player_health = _float(you.get("health", self.player_health))
+        self.player_downed = _bool(you.get("downed", self.player_downed))
+        self.player_money = _int(you.get("money", self.player_money))
+        self.player_kills = _int(you.get("kills", self.player_kills))
+        self.player_deaths = _int(you.get("deaths", self.player_deaths))
+        self.player_headshots = _int(you.get("headshots", self.player_headshots))
+        self.current_weapon = _str(you.get("weapon", self.current_weapon))
 
         ammo_data = you.get("ammo")
         if isinstance(ammo_data, dict):
             for weapon in WEAPON_ORDER:
                 if weapon in ammo_data:
-                    self.ammo[weapon] = int(ammo_data[weapon])
+                    self.ammo[weapon] = _int(ammo_data[weapon])
 
         clip_data = you.get("clip")
         if isinstance(clip_data, dict):
             for weapon in WEAPON_ORDER:
                 if weapon in clip_data:
-                    self.clip[weapon] = int(clip_data[weapon])
+                    self.clip[weapon] = _int(clip_data[weapon])
 
         owned_data = you.get("owned")
         if isinstance(owned_data, dict):
             for weapon in WEAPON_ORDER:
                 if weapon in owned_data:
-                    self.owned_weapons[weapon] = bool(owned_data[weapon])
+                    self.owned_weapons[weapon] = _bool(owned_data[weapon])
 
-        self.wave = int(payload.get("wave", self.wave))
-        self.game_state = str(payload.get("game_state", self.game_state))
-        self.objective_type = str(payload.get("objective_type", self.objective_type))
-        self.objective_timer = float(payload.get("objective_timer", self.objective_timer))
-        self.shared_money = bool(payload.get("shared_money", self.shared_money))
+        self.wave = _int(payload.get("wave", self.wave))
+        self.game_state = _str(payload.get("game_state", self.game_state))
+        self.objective_type = _str(payload.get("objective_type", self.objective_type))
+        self.objective_timer = _float(payload.get("objective_timer", self.objective_timer))
+        self.shared_money = _bool(payload.get("shared_money", self.shared_money))
         zone = payload.get("objective_zone")
         if isinstance(zone, (list, tuple)) and len(zone) == 3:
             try:
-                self.objective_zone = (float(zone[0]), float(zone[1]), float(zone[2]))
+                self.objective_zone = (_float(zone[0]), _float(zone[1]), _float(zone[2]))
             except (TypeError, ValueError):
                 self.objective_zone = None
         elif zone is None:
@@ -738,77 +1024,72 @@ class FPSBotArena:
         if isinstance(ping, dict):
             try:
                 self.team_ping = (
-                    float(ping.get("x", 0.0)),
-                    float(ping.get("y", 0.0)),
-                    float(ping.get("ttl", 0.0)),
-                    str(ping.get("owner", "TEAM")),
+                    _float(ping.get("x", 0.0)),
+                    _float(ping.get("y", 0.0)),
+                    _float(ping.get("ttl", 0.0)),
+                    _str(ping.get("owner", "TEAM")),
                 )
             except (TypeError, ValueError):
                 self.team_ping = None
         elif ping is None:
             self.team_ping = None
 
-        self.bots = []
-        for item in payload.get("bots", []):
-            self.bots.append(
-                Bot(
-                    x=float(item.get("x", 0.0)),
-                    y=float(item.get("y", 0.0)),
-                    health=float(item.get("health", 100.0)),
-                    speed=float(item.get("speed", 1.2)),
-                    kind=str(item.get("kind", "grunt")),
-                    state=str(item.get("state", "advance")),
-                    alive=bool(item.get("alive", True)),
-                    attack_range=float(item.get("attack_range", 11.5)),
-                    hit_bonus=float(item.get("hit_bonus", 0.0)),
-                    damage_min=int(item.get("damage_min", 4)),
-                    damage_max=int(item.get("damage_max", 9)),
-                    money_multiplier=float(item.get("money_multiplier", 1.0)),
-                )
-            )
-
-        self.money_drops = []
-        for item in payload.get("drops", []):
-            self.money_drops.append(
-                MoneyDrop(
-                    x=float(item.get("x", 0.0)),
-                    y=float(item.get("y", 0.0)),
-                    value=int(item.get("value", 0)),
-                    ttl=float(item.get("ttl", 24.0)),
-                )
-            )
+        # Mutate pooled instances in place; allocating fresh dataclasses for
+        # every 30 Hz snapshot churns the allocator for no benefit.
+        bot_items = payload.get("bots", [])
+        while len(self._bot_pool) < len(bot_items):
+            self._bot_pool.append(Bot(x=0.0, y=0.0, health=0.0, speed=0.0))
+        # Snapshots carry only the render-facing bot fields; the simulation
+        # stats live on the host and the pooled defaults (alive=True) hold.
+        for bot, item in zip(self._bot_pool, bot_items):
+            bot.x = _float(item.get("x", 0.0))
+            bot.y = _float(item.get("y", 0.0))
+            bot.health = _float(item.get("health", 100.0))
+            bot.kind = _str(item.get("kind", "grunt"))
+            bot.state = _str(item.get("state", "advance"))
+        self.bots = self._bot_pool[: len(bot_items)]
+        self._mark_bots_dirty()
+
+        drop_items = payload.get("drops", [])
+        while len(self._drop_pool) < len(drop_items):
+            self._drop_pool.append(MoneyDrop(x=0.0, y=0.0, value=0))
+        for drop, item in zip(self._drop_pool, drop_items):
+            drop.x = _float(item.get("x", 0.0))
+            drop.y = _float(item.get("y", 0.0))
+            drop.value = _int(item.get("value", 0))
+            drop.ttl = _float(item.get("ttl", 24.0))
+        self.money_drops = self._drop_pool[: len(drop_items)]
 
         seen: set[str] = set()
+        membership_changed = False
         for item in payload.get("players", []):
-            player_id = str(item.get("id", ""))
+            player_id = _str(item.get("id", ""))
             if player_id == self.player_id:
                 continue
-            tx = float(item.get("x", 0.0))
-            ty = float(item.get("y", 0.0))
-            ta = float(item.get("angle", 0.0))
-            th = float(item.get("health", 0.0))
-            tw = str(item.get("weapon", "pistol"))
-            tn = str(item.get("name", "Teammate"))
-            tdowned = bool(item.get("downed", False))
-            tmoney = int(item.get("money", 0))
-            tkills = int(item.get("kills", 0))
-            tdeaths = int(item.get("deaths", 0))
-            theadshots = int(item.get("headshots", 0))
-            self.remote_interp_targets[player_id] = (
-                tx,
-                ty,
-                ta,
-                th,
-                tw,
-                tdowned,
-                tn,
-                tmoney,
-                tkills,
-                tdeaths,
-                theadshots,
-            )
+            tx = _float(item.get("x", 0.0))
+            ty = _float(item.get("y", 0.0))
+            ta = _float(item.get("angle", 0.0))
+            th = _float(item.get("health", 0.0))
+            tw = _str(item.get("weapon", "pistol"))
+            tn = _str(item.get("name", "Teammate"))
+            tdowned = _bool(item.get("downed", False))
+            tmoney = _int(item.get("money", 0))
+            tkills = _int(item.get("kills", 0))
+            tdeaths = _int(item.get("deaths", 0))
+            theadshots = _int(item.get("headshots", 0))
+            # Only the pose interpolates between snapshots; every other field
+            # is display-only and syncs here, once per snapshot, instead of
+            # being rewritten every frame by the interpolation tick.
+            target = self.remote_interp_targets.get(player_id)
+            if target is None:
+                self.remote_interp_targets[player_id] = RemoteInterpTarget(tx, ty, ta)
+            else:
+                target.x = tx
+                target.y = ty
+                target.angle = ta
             view = self.remote_render_map.get(player_id)
             if view is None:
+                membership_changed = True
                 view = TeammateView(
                     player_id=player_id,
                     name=tn,
@@ -824,41 +1105,45 @@ class FPSBotArena:
                     headshots=theadshots,
                 )
                 self.remote_render_map[player_id] = view
+            else:
+                view.health = th
+                view.weapon = tw
+                view.name = tn
+                view.downed = tdowned
+                view.money = tmoney
+                view.kills = tkills
+                view.deaths = tdeaths
+                view.headshots = theadshots
             seen.add(player_id)
 
         for player_id in list(self.remote_render_map.keys()):
             if player_id not in seen:
+                membership_changed = True
                 self.remote_render_map.pop(player_id, None)
                 self.remote_interp_targets.pop(player_id, None)
 
-        self.remote_render_players = list(self.remote_render_map.values())
-
-        self.net_status = f"Connected teammates: {len(self.remote_render_players)}"
+        # The views mutate in place, so the render list only needs rebuilding
+        # when a teammate joined or left, not on every 30 Hz snapshot.
+        if membership_changed:
+            self.remote_render_players = list(self.remote_render_map.values())
+            self.net_status = f"Connected teammates: {len(self.remote_render_players)}"
 
     def update_remote_interpolation(self, dt: float) -> None:
         if self.net_mode != "client":
             return
         blend = clamp(dt * 10.0, 0.0, 1.0)
+        tau = math.tau
+        pi = math.pi
+        targets_get = self.remote_interp_targets.get
         for player_id, view in self.remote_render_map.items():
-            target = self.remote_interp_targets.get(player_id)
+            target = targets_get(player_id)
             if target is None:
                 continue
-            tx, ty, ta, th, tw, tdowned, tn, tmoney, tkills, tdeaths, theadshots = target
-            view.x += (tx - view.x) * blend
-            view.y += (ty - view.y) * blend
-            da = normalize_angle(ta - view.angle)
-            if da > math.pi:
-                da -= math.tau
-            view.angle = normalize_angle(view.angle + da * blend)
-            view.health = th
-            view.weapon = tw
-            view.name = tn
-            view.downed = tdowned
-            view.money = tmoney
-            view.kills = tkills
-            view.deaths = tdeaths
-            view.headshots = theadshots
-        self.remote_render_players = list(self.remote_render_map.values())
+            view.x += (target.x - view.x) * blend
+            view.y += (target.y - view.y) * blend
+            # Branchless shortest-arc blend.
+            da = (target.angle - view.angle + pi) % tau - pi
+            view.angle = (view.angle + da * blend) % tau
 
     def send_client_input(self, now: float) -> None:
         if self.coop_client is None or not self.client_connected:
@@ -867,13 +1152,13 @@ class FPSBotArena:
             return
 
         self.last_net_send = now
-        allowed = ["w", "a", "s", "d", "shift_l", "shift_r", "left", "right", "e", "r", "q"]
-        pressed = [key for key in allowed if key in self.keys]
+        mask = self.local_keymask & WIRE_KEY_MASK
         self.coop_client.send(
             {
                 "type": "input",
-                "keys": pressed,
+                "keys": mask,
                 "angle": self.player_angle,
+                "ack_ts": self._last_snapshot_ts,
                 "shoot": bool(
                     self.mouse_down
                     and not self.shop_open
@@ -884,43 +1169,62 @@ class FPSBotArena:
             }
         )
 
-    def serialize_remote(self, remote: RemotePlayer) -> dict:
-        return {
+    def serialize_remote(self, remote: RemotePlayer, with_loadout: bool = True) -> dict:
+        data = {
             "id": remote.player_id,
             "name": remote.name,
-            "x": remote.x,
-            "y": remote.y,
-            "angle": remote.angle,
-            "health": remote.health,
+            "x": round(remote.x, 3),
+            "y": round(remote.y, 3),
+            "angle": round(remote.angle, 4),
+            "health": round(remote.health, 1),
             "downed": remote.downed,
             "money": remote.money,
             "kills": remote.kills,
             "deaths": remote.deaths,
             "headshots": remote.headshots,
             "weapon": remote.current_weapon,
-            "ammo": dict(remote.ammo),
-            "clip": dict(remote.clip),
-            "owned": dict(remote.owned_weapons),
         }
-
-    def serialize_local(self) -> dict:
-        return {
+        if with_loadout:
+            # Loadout dicts only change on shoot/reload/buy; the dirty flag
+            # skips three dict copies per player per broadcast in between,
+            # and apply_snapshot tolerates the missing keys.
+            if remote.ammo.dirty:
+                data["ammo"] = dict(remote.ammo)
+                remote.ammo.dirty = False
+            if remote.clip.dirty:
+                data["clip"] = dict(remote.clip)
+                remote.clip.dirty = False
+            if remote.owned_weapons.dirty:
+                data["owned"] = dict(remote.owned_weapons)
+                remote.owned_weapons.dirty = False
+        return data
+
+    def serialize_local(self, with_loadout: bool = True) -> dict:
+        data = {
             "id": "host",
             "name": self.player_name,
-            "x": self.player_x,
-            "y": self.player_y,
-            "angle": self.player_angle,
-            "health": self.player_health,
+            "x": round(self.player_x, 3),
+            "y": round(self.player_y, 3),
+            "angle": round(self.player_angle, 4),
+            "health": round(self.player_health, 1),
             "downed": self.player_downed,
             "money": self.player_money,
             "kills": self.player_kills,
             "deaths": self.player_deaths,
             "headshots": self.player_headshots,
             "weapon": self.current_weapon,
-            "ammo": dict(self.ammo),
-            "clip": dict(self.clip),
-            "owned": dict(self.owned_weapons),
         }
+        if with_loadout:
+            if self.ammo.dirty:
+                data["ammo"] = dict(self.ammo)
+                self.ammo.dirty = False
+            if self.clip.dirty:
+                data["clip"] = dict(self.clip)
+                self.clip.dirty = False
+            if self.owned_weapons.dirty:
+                data["owned"] = dict(self.owned_weapons)
+                self.owned_weapons.dirty = False
+        return data
 
     def broadcast_snapshot(self, now: float) -> None:
         if self.coop_server is None:
@@ -929,38 +1233,52 @@ class FPSBotArena:
             return
         self.last_net_send = now
 
-        players = [self.serialize_local()] + [self.serialize_remote(p) for p in self.remote_players.values()]
+        # Per-client adaptive rate: clients with a high measured RTT gain
+        # nothing from snapshots arriving faster than their link returns
+        # acks, so stretch their interval instead of queueing frames. With
+        # every interval stretched, most broadcast ticks have nobody due --
+        # bail before building the shared lists below for no recipient.
+        due = [r for r in self.remote_players.values() if now >= r.next_send_at]
+        if not due:
+            return
+
+        # The shared players list is the public view: apply_snapshot only
+        # reads loadout fields from "you", so skip the three dict copies per
+        # player entry per broadcast.
+        players = [self.serialize_local(with_loadout=False)] + [
+            self.serialize_remote(p, with_loadout=False) for p in self.remote_players.values()
+        ]
+        # Clients only render bots; speed, combat stats, and payouts are
+        # host-side simulation state, and every entry here is alive by
+        # construction, so none of those belong on the wire.
         bots = [
             {
-                "x": b.x,
-                "y": b.y,
-                "health": b.health,
-                "speed": b.speed,
+                "x": round(b.x, 3),
+                "y": round(b.y, 3),
+                "health": round(b.health, 1),
                 "kind": b.kind,
                 "state": b.state,
-                "alive": b.alive,
-                "attack_range": b.attack_range,
-                "hit_bonus": b.hit_bonus,
-                "damage_min": b.damage_min,
-                "damage_max": b.damage_max,
-                "money_multiplier": b.money_multiplier,
             }
-            for b in self.bots
-            if b.alive
+            for b in self.get_alive_bots()
+        ]
+        drops = [
+            {"x": round(d.x, 3), "y": round(d.y, 3), "value": d.value, "ttl": round(d.ttl, 2)}
+            for d in self.money_drops
         ]
-        drops = [{"x": d.x, "y": d.y, "value": d.value, "ttl": d.ttl} for d in self.money_drops]
         ping = None
         if self.team_ping is not None:
             ping = {
-                "x": self.team_ping[0],
-                "y": self.team_ping[1],
-                "ttl": self.team_ping[2],
+                "x": round(self.team_ping[0], 3),
+                "y": round(self.team_ping[1], 3),
+                "ttl": round(self.team_ping[2], 2),
                 "owner": self.team_ping[3],
             }
 
-        for remote in self.remote_players.values():
+        for remote in due:
+            remote.next_send_at = now + clamp(remote.rtt_ms * 1.5, 33.0, 100.0) / 1000.0
             payload = {
                 "type": "snapshot",
+                "ts": round(now, 3),
                 "you_id": remote.player_id,
                 "you": self.serialize_remote(remote),
                 "players": players,
@@ -969,7 +1287,7 @@ class FPSBotArena:
                 "wave": self.wave,
                 "game_state": self.game_state,
                 "objective_type": self.objective_type,
-                "objective_timer": self.objective_timer,
+                "objective_timer": round(self.objective_timer, 2),
                 "objective_zone": self.objective_zone,
                 "shared_money": self.shared_money,
                 "ping": ping,
@@ -984,15 +1302,15 @@ class FPSBotArena:
             remote.current_weapon = weapon
             return
 
-        config = WEAPON_DATA[weapon]
-        if remote.money < config["cost"]:
+        weapon_id = WEAPON_ID[weapon]
+        if remote.money < WEAPON_COST[weapon_id]:
             return
 
-        remote.money -= config["cost"]
+        remote.money -= WEAPON_COST[weapon_id]
         remote.owned_weapons[weapon] = True
-        remote.ammo[weapon] += config["ammo_pack"]
-        if remote.clip[weapon] <= 0 and not config["infinite"]:
-            needed = int(config["mag_size"])
+        remote.ammo[weapon] += WEAPON_AMMO_PACK[weapon_id]
+        if remote.clip[weapon] <= 0 and not WEAPON_INFINITE[weapon_id]:
+            needed = WEAPON_MAG_SIZE[weapon_id]
             loaded = min(needed, remote.ammo[weapon])
             remote.clip[weapon] += loaded
             remote.ammo[weapon] -= loaded
@@ -1000,9 +1318,23 @@ class FPSBotArena:
         remote.revive_progress = 0.0
 
     def update_remote_players(self, dt: float, now: float) -> None:
+        # Host-tick hot loop: keep the numeric core free of repeated global
+        # and attribute lookups; cost scales with teammate count.
+        sin = math.sin
+        cos = math.cos
+        tau = math.tau
+        can_move = self.can_move
+        radius = PLAYER_RADIUS
+        # dt is fixed for the tick, so every per-remote product of a
+        # constant and dt is the same number; compute each once.
+        walk_step = 3.2 * dt
+        sprint_step = 4.2 * dt
+        turn_step = 1.7 * dt
+        regen_step = HEALTH_REGEN_RATE * dt
+        regen_delay = HEALTH_REGEN_DELAY
         for remote in self.remote_players.values():
             if remote.downed:
-                if "e" in remote.keys and self.player_downed and distance(remote.x, remote.y, self.player_x, self.player_y) <= 1.7:
+                if remote.keymask & KEYBIT_E and self.player_downed and distance_sq(remote.x, remote.y, self.player_x, self.player_y) <= 1.7 * 1.7:
                     self.player_revive_progress += dt
                     if self.player_revive_progress >= 2.3:
                         self.player_downed = False
@@ -1014,45 +1346,49 @@ class FPSBotArena:
                 continue
 
             remote.time_since_damage += dt
-            speed = 3.2
-            if "shift_l" in remote.keys or "shift_r" in remote.keys:
-                speed = 4.2
+            keymask = remote.keymask
+            step = sprint_step if keymask & KEYBIT_SPRINT else walk_step
 
             move_x = 0.0
             move_y = 0.0
-            sin_a = math.sin(remote.angle)
-            cos_a = math.cos(remote.angle)
-
-            if "w" in remote.keys:
-                move_x += cos_a * speed * dt
-                move_y += sin_a * speed * dt
-            if "s" in remote.keys:
-                move_x -= cos_a * speed * dt
-                move_y -= sin_a * speed * dt
-            if "a" in remote.keys:
-                move_x += math.cos(remote.angle - math.pi / 2) * speed * dt
-                move_y += math.sin(remote.angle - math.pi / 2) * speed * dt
-            if "d" in remote.keys:
-                move_x += math.cos(remote.angle + math.pi / 2) * speed * dt
-                move_y += math.sin(remote.angle + math.pi / 2) * speed * dt
-
-            if "left" in remote.keys:
-                remote.angle -= 1.7 * dt
-            if "right" in remote.keys:
-                remote.angle += 1.7 * dt
-            remote.angle = normalize_angle(remote.angle)
+            angle = remote.angle
+            sin_a = sin(angle)
+            cos_a = cos(angle)
+
+            if keymask & KEYBIT_W:
+                move_x += cos_a * step
+                move_y += sin_a * step
+            if keymask & KEYBIT_S:
+                move_x -= cos_a * step
+                move_y -= sin_a * step
+            # Strafe basis from identities: cos(a∓π/2) = ±sin a,
+            # sin(a∓π/2) = ∓cos a — no extra transcendental calls.
+            if keymask & KEYBIT_A:
+                move_x += sin_a * step
+                move_y -= cos_a * step
+            if keymask & KEYBIT_D:
+                move_x -= sin_a * step
+                move_y += cos_a * step
+
+            if keymask & KEYBIT_LEFT:
+                angle -= turn_step
+            if keymask & KEYBIT_RIGHT:
+                angle += turn_step
+            remote.angle = angle % tau
 
             next_x = remote.x + move_x
             next_y = remote.y + move_y
-            if self.can_move(next_x, remote.y, PLAYER_RADIUS):
+            if can_move(next_x, remote.y, radius):
                 remote.x = next_x
-            if self.can_move(remote.x, next_y, PLAYER_RADIUS):
+            if can_move(remote.x, next_y, radius):
                 remote.y = next_y
 
-            if remote.health < 100.0 and remote.time_since_damage >= HEALTH_REGEN_DELAY:
-                remote.health = min(100.0, remote.health + HEALTH_REGEN_RATE * dt)
+            # Clamp instead of gating on health < 100: the min() is cheaper
+            # than a branch that flips between hurt and healed teammates.
+            if remote.time_since_damage >= regen_delay:
+                remote.health = min(100.0, remote.health + regen_step)
 
-            if "q" in remote.keys:
+            if keymask & KEYBIT_Q:
                 self.team_ping = (remote.x, remote.y, 5.5, remote.name)
 
             self.handle_remote_shooting(remote, now)
@@ -1064,18 +1400,19 @@ class FPSBotArena:
             return
 
         weapon = remote.current_weapon
-        config = WEAPON_DATA[weapon]
-        if not config["infinite"] and remote.clip[weapon] <= 0:
-            needed = int(config["mag_size"])
+        weapon_id = WEAPON_ID[weapon]
+        infinite = WEAPON_INFINITE[weapon_id]
+        if not infinite and remote.clip[weapon] <= 0:
+            needed = WEAPON_MAG_SIZE[weapon_id]
             loaded = min(needed, remote.ammo[weapon])
             remote.clip[weapon] += loaded
             remote.ammo[weapon] -= loaded
-        if not config["infinite"] and remote.clip[weapon] <= 0:
+        if not infinite and remote.clip[weapon] <= 0:
             remote.current_weapon = "pistol"
             return
 
-        remote.next_fire_at = now + config["fire_rate"]
-        if not config["infinite"]:
+        remote.next_fire_at = now + WEAPON_FIRE_RATE[weapon_id]
+        if not infinite:
             remote.clip[weapon] = max(0, remote.clip[weapon] - 1)
 
         if weapon == "rpg":
@@ -1083,16 +1420,24 @@ class FPSBotArena:
             self.glitch_timer = 1.2
             return
 
-        for _ in range(config["pellets"]):
-            shot_angle = remote.angle + random.uniform(-config["spread"], config["spread"])
-            target, headshot = self.get_first_bot_hit_from(remote.x, remote.y, shot_angle, config["range"])
+        uniform = random.uniform
+        spread = WEAPON_SPREAD[weapon_id]
+        shot_range = WEAPON_RANGE[weapon_id]
+        damage = WEAPON_DAMAGE[weapon_id]
+        base_angle = remote.angle
+        shot_x = remote.x
+        shot_y = remote.y
+        hit_from = self.get_first_bot_hit_from
+        shooter_id = remote.player_id
+        for _ in range(WEAPON_PELLETS[weapon_id]):
+            target, headshot = hit_from(shot_x, shot_y, base_angle + uniform(-spread, spread), shot_range, shooter_id)
             if target is None:
                 continue
-            target.health -= config["damage"]
+            target.health -= damage
             if target.health <= 0 and target.alive:
                 self.kill_bot(target, killer_id=remote.player_id, headshot=headshot)
 
-        if not config["infinite"] and remote.clip[weapon] <= 0 and remote.ammo[weapon] <= 0:
+        if not infinite and remote.clip[weapon] <= 0 and remote.ammo[weapon] <= 0:
             remote.current_weapon = "pistol"
 
     def all_humans_dead(self) -> bool:
@@ -1126,7 +1471,10 @@ class FPSBotArena:
                 self.on_close()
             return
 
-        self.keys.add(key)
+        key_id = KEY_IDS.get(key)
+        if key_id is not None:
+            self.keys_state[key_id] = 1
+            self.local_keymask |= 1 << key_id
 
         if key == "b" and self.game_state == "playing":
             self.shop_open = not self.shop_open
@@ -1164,7 +1512,10 @@ class FPSBotArena:
 
     def on_key_up(self, event: tk.Event) -> None:
         key = event.keysym.lower()
-        self.keys.discard(key)
+        key_id = KEY_IDS.get(key)
+        if key_id is not None:
+            self.keys_state[key_id] = 0
+            self.local_keymask &= ~(1 << key_id)
 
     def on_focus_in(self, _event: tk.Event) -> None:
         self.focused = True
@@ -1193,6 +1544,7 @@ class FPSBotArena:
     def on_close(self) -> None:
         self.save_user_settings()
         self.save_profile()
+        self.flush_profile(time.perf_counter(), force=True)
         self.release_cursor_clip()
         if self.coop_server is not None:
             self.coop_server.stop()
@@ -1204,6 +1556,14 @@ class FPSBotArena:
         self.mouse_locked = capture
         self.smoothed_mouse_dx = 0.0
         self.next_warp_allowed_at = 0.0
+
+        # Only listen for <Motion> while mouselook is active; menu hover
+        # otherwise fires a Python callback for every pixel of travel.
+        if capture:
+            self.root.bind("<Motion>", self.on_mouse_move)
+        else:
+            self.root.unbind("<Motion>")
+
         if not self.focused:
             return
 
@@ -1253,12 +1613,18 @@ class FPSBotArena:
         top = self.canvas.winfo_rooty()
         right = left + self.canvas.winfo_width()
         bottom = top + self.canvas.winfo_height()
+        # Configure/focus events re-fire this with an unchanged canvas;
+        # skip the ctypes round-trip when the rect is already applied.
+        if (left, top, right, bottom) == self._last_clip_rect:
+            return
         rect = wintypes.RECT(left, top, right, bottom)
         ctypes.windll.user32.ClipCursor(ctypes.byref(rect))
+        self._last_clip_rect = (left, top, right, bottom)
 
     def release_cursor_clip(self) -> None:
-        if HAS_WIN32:
+        if HAS_WIN32 and self._last_clip_rect is not None:
             ctypes.windll.user32.ClipCursor(None)
+            self._last_clip_rect = None
 
     def on_mouse_move(self, event: tk.Event) -> None:
         if not self.mouse_locked:
@@ -1267,7 +1633,6 @@ class FPSBotArena:
             self.last_mouse_y = event.y
             return
 
-        now = time.perf_counter()
         dx = event.x - self.last_mouse_x
         self.last_mouse_x = event.x
         self.last_mouse_y = event.y
@@ -1275,17 +1640,9 @@ class FPSBotArena:
         if dx == 0:
             return
 
-        dx = clamp(dx, -180, 180)
-        if self.mouse_smoothing_enabled:
-            alpha = self.mouse_smoothing_strength
-            self.smoothed_mouse_dx = self.smoothed_mouse_dx * (1.0 - alpha) + dx * alpha
-            look_dx = self.smoothed_mouse_dx
-        else:
-            self.smoothed_mouse_dx = dx
-            look_dx = dx
-
-        self.player_angle += look_dx * self.mouse_sensitivity
-        self.player_angle = normalize_angle(self.player_angle)
+        # Accumulate: several <Motion> events can land between frames and
+        # overwriting would silently drop the earlier deltas.
+        self._pending_mouse_dx += clamp(dx, -180, 180)
         if self.use_warp_mouse:
             width = self.canvas.winfo_width()
             height = self.canvas.winfo_height()
@@ -1295,9 +1652,11 @@ class FPSBotArena:
                 or event.y < MOUSE_WARP_EDGE_MARGIN
                 or event.y > height - MOUSE_WARP_EDGE_MARGIN
             )
-            if near_edge and now >= self.next_warp_allowed_at:
-                self.center_mouse()
-                self.next_warp_allowed_at = now + MOUSE_WARP_INTERVAL_SECONDS
+            if near_edge:
+                now = time.perf_counter()
+                if now >= self.next_warp_allowed_at:
+                    self.center_mouse()
+                    self.next_warp_allowed_at = now + MOUSE_WARP_INTERVAL_SECONDS
 
     def on_mouse_down(self, event: tk.Event) -> None:
         if self.pause_open:
@@ -1309,6 +1668,9 @@ class FPSBotArena:
             if self.game_state == "playing":
                 self.place_team_ping()
             return
+        if button != 1:
+            # Scroll wheels report as buttons 4/5 on X11.
+            return
 
         self.mouse_down = True
         if self.shop_open and self.game_state == "playing":
@@ -1397,27 +1759,28 @@ class FPSBotArena:
         else:
             owner = "YOU"
         distance_out = 4.2
-        px = self.player_x + math.cos(self.player_angle) * distance_out
-        py = self.player_y + math.sin(self.player_angle) * distance_out
+        cos_a = math.cos(self.player_angle)
+        sin_a = math.sin(self.player_angle)
+        px = self.player_x + cos_a * distance_out
+        py = self.player_y + sin_a * distance_out
         if self.is_wall(px, py):
-            px = self.player_x + math.cos(self.player_angle) * 2.2
-            py = self.player_y + math.sin(self.player_angle) * 2.2
+            px = self.player_x + cos_a * 2.2
+            py = self.player_y + sin_a * 2.2
         self.team_ping = (px, py, 5.5, owner)
 
     def start_reload(self, now: float) -> None:
         weapon = self.current_weapon
-        config = WEAPON_DATA[weapon]
-        if config["infinite"]:
+        weapon_id = WEAPON_ID[weapon]
+        if WEAPON_INFINITE[weapon_id]:
             return
         if self.current_reload_weapon is not None:
             return
-        mag_size = int(config["mag_size"])
-        if self.clip[weapon] >= mag_size:
+        if self.clip[weapon] >= WEAPON_MAG_SIZE[weapon_id]:
             return
         if self.ammo[weapon] <= 0:
             return
         self.current_reload_weapon = weapon
-        self.reload_end_at = now + float(config["reload_time"])
+        self.reload_end_at = now + WEAPON_RELOAD_TIME[weapon_id]
 
     def update_reload(self, now: float) -> None:
         if self.current_reload_weapon is None:
@@ -1425,8 +1788,7 @@ class FPSBotArena:
         if now < self.reload_end_at:
             return
         weapon = self.current_reload_weapon
-        config = WEAPON_DATA[weapon]
-        mag_size = int(config["mag_size"])
+        mag_size = WEAPON_MAG_SIZE[WEAPON_ID[weapon]]
         needed = max(0, mag_size - self.clip[weapon])
         loaded = min(needed, self.ammo[weapon])
         self.clip[weapon] += loaded
@@ -1437,51 +1799,86 @@ class FPSBotArena:
         if self.game_state != "playing":
             return
 
-        config = WEAPON_DATA[weapon]
+        weapon_id = WEAPON_ID[weapon]
         if self.owned_weapons[weapon]:
             self.current_weapon = weapon
             self.current_reload_weapon = None
             return
 
-        if self.player_money < config["cost"]:
+        if self.player_money < WEAPON_COST[weapon_id]:
             return
 
-        self.player_money -= config["cost"]
+        self.player_money -= WEAPON_COST[weapon_id]
         self.owned_weapons[weapon] = True
-        self.ammo[weapon] += config["ammo_pack"]
+        self.ammo[weapon] += WEAPON_AMMO_PACK[weapon_id]
         self.current_weapon = weapon
-        if not config["infinite"] and self.clip[weapon] <= 0:
+        if not WEAPON_INFINITE[weapon_id] and self.clip[weapon] <= 0:
             self.start_reload(time.perf_counter())
 
     def loop(self) -> None:
-        now = time.perf_counter()
-        dt = min(now - self.last_time, 0.05)
-        self.last_time = now
+        # Integer-ns frame timing: one clock read per frame, no float
+        # rounding in the dt subtraction. perf_counter_ns shares an epoch
+        # with perf_counter, so one-off timestamps elsewhere still line up.
+        now_ns = time.perf_counter_ns()
+        dt = min((now_ns - self.last_time_ns) * 1e-9, 0.05)
+        self.last_time_ns = now_ns
+        now = now_ns * 1e-9
         self.adjust_render_quality(dt, now)
 
         self.update(dt, now)
         self.render(now)
+        self.flush_profile(now)
 
-        ms = int(1000 / max(MIN_FPS_CAP, self.fps_limit))
-        self.root.after(ms, self.loop)
+        # Schedule against the frame start so update/render cost does not
+        # stretch the interval.
+        target_ms = 1000 // max(MIN_FPS_CAP, self.fps_limit)
+        spent_ms = (time.perf_counter_ns() - now_ns) // 1_000_000
+        self.root.after(max(1, target_ms - int(spent_ms)), self.loop)
 
     def adjust_render_quality(self, dt: float, now: float) -> None:
         global RAY_COUNT
         self.frame_dt_avg = self.frame_dt_avg * 0.9 + dt * 0.1
         if not self.adaptive_quality_enabled:
             return
-        if now - self.last_quality_adjust < 0.55:
+        if now - self.last_quality_adjust < 0.25:
             return
 
-        target_dt = 1.0 / max(MIN_FPS_CAP, min(120, self.fps_limit))
-        if self.frame_dt_avg > target_dt * 1.2 and RAY_COUNT > 160:
-            RAY_COUNT = max(160, RAY_COUNT - 10)
+        # Hysteretic controller: back off 10% when over budget, recover 5%
+        # when comfortably under, so the counts settle instead of
+        # oscillating around the cap. Rays and the sprite budget move
+        # together; render_sprites sheds the farthest sprites first.
+        budget = 1.0 / max(MIN_FPS_CAP, min(120, self.fps_limit))
+        if self.frame_dt_avg > budget * 1.1 and (RAY_COUNT > 160 or self.sprite_budget > SPRITE_BUDGET_MIN):
+            RAY_COUNT = max(160, int(RAY_COUNT * 0.9))
+            self.sprite_budget = max(SPRITE_BUDGET_MIN, int(self.sprite_budget * 0.9))
             self.last_quality_adjust = now
-        elif self.frame_dt_avg < target_dt * 0.82 and RAY_COUNT < self.base_ray_target:
-            RAY_COUNT = min(self.base_ray_target, RAY_COUNT + 8)
+        elif self.frame_dt_avg < budget * 0.85 and (RAY_COUNT < self.base_ray_target or self.sprite_budget < SPRITE_BUDGET_MAX):
+            RAY_COUNT = min(self.base_ray_target, max(RAY_COUNT + 1, int(RAY_COUNT * 1.05)))
+            self.sprite_budget = min(SPRITE_BUDGET_MAX, max(self.sprite_budget + 1, int(self.sprite_budget * 1.05)))
             self.last_quality_adjust = now
 
+    def _apply_pending_mouse_look(self, dt: float) -> None:
+        dx = self._pending_mouse_dx
+        self._pending_mouse_dx = 0.0
+        if not self.mouse_locked:
+            return
+
+        if self.mouse_smoothing_enabled:
+            # One-pole filter keyed on dt so aim feel does not change with
+            # frame rate; matches the old per-event alpha at 60 Hz.
+            alpha = 1.0 - (1.0 - self.mouse_smoothing_strength) ** (dt * TARGET_FPS)
+            self.smoothed_mouse_dx += (dx - self.smoothed_mouse_dx) * alpha
+            look_dx = self.smoothed_mouse_dx
+        else:
+            self.smoothed_mouse_dx = dx
+            look_dx = dx
+
+        if look_dx:
+            self.player_angle = normalize_angle(self.player_angle + look_dx * self.mouse_sensitivity)
+
     def update(self, dt: float, now: float) -> None:
+        self._apply_pending_mouse_look(dt)
+        self._los_cache.clear()
         if self.team_ping is not None:
             self.team_ping = (self.team_ping[0], self.team_ping[1], self.team_ping[2] - dt, self.team_ping[3])
             if self.team_ping[2] <= 0:
@@ -1494,7 +1891,7 @@ class FPSBotArena:
                 self.process_client_network_events()
                 self.update_remote_interpolation(dt)
             elif self.net_mode == "host":
-                self.process_host_network_events()
+                self.process_host_network_events(now)
                 self.broadcast_snapshot(now)
             self.damage_flash = max(0.0, self.damage_flash - dt * 2.8)
             self.muzzle_flash_timer = max(0.0, self.muzzle_flash_timer - dt * 5.0)
@@ -1514,7 +1911,7 @@ class FPSBotArena:
             return
 
         if self.net_mode == "host":
-            self.process_host_network_events()
+            self.process_host_network_events(now)
 
         if self.game_state == "playing":
             self.update_reload(now)
@@ -1532,7 +1929,7 @@ class FPSBotArena:
 
             if self.player_health <= 0 and not self.player_downed:
                 self.player_health = 0
-            elif self.player_health < self.get_max_health_cap() and self.time_since_damage >= HEALTH_REGEN_DELAY:
+            elif self.time_since_damage >= HEALTH_REGEN_DELAY:
                 regen = HEALTH_REGEN_RATE * self.get_regen_multiplier()
                 self.player_health = min(self.get_max_health_cap(), self.player_health + regen * dt)
 
@@ -1581,32 +1978,31 @@ class FPSBotArena:
         if self.net_mode != "host":
             return
 
-        # Local player revives nearby downed teammate.
-        if "e" in self.keys and self.player_health > 0 and not self.player_downed:
-            best_remote: RemotePlayer | None = None
-            best_dist = 999.0
+        # Local player revives nearby downed teammate. Pick the closest one
+        # first, then fold the progress/bleed-out bookkeeping into a single
+        # sweep instead of three back-to-back passes over the roster.
+        best_remote: RemotePlayer | None = None
+        if self.keys_state[KEY_E] and self.player_health > 0 and not self.player_downed:
+            best_dist_sq = 1.7 * 1.7
             for remote in self.remote_players.values():
                 if not remote.downed:
                     continue
-                d = distance(self.player_x, self.player_y, remote.x, remote.y)
-                if d < 1.7 and d < best_dist:
+                d_sq = distance_sq(self.player_x, self.player_y, remote.x, remote.y)
+                if d_sq < best_dist_sq:
                     best_remote = remote
-                    best_dist = d
-            if best_remote is not None:
-                best_remote.revive_progress += dt
-                if best_remote.revive_progress >= 2.3:
-                    best_remote.downed = False
-                    best_remote.bleed_out = 0.0
-                    best_remote.revive_progress = 0.0
-                    best_remote.health = 40.0
-            for remote in self.remote_players.values():
-                if remote is not best_remote:
-                    remote.revive_progress = max(0.0, remote.revive_progress - dt * 1.6)
-        else:
-            for remote in self.remote_players.values():
-                remote.revive_progress = max(0.0, remote.revive_progress - dt * 1.6)
+                    best_dist_sq = d_sq
 
         for remote in self.remote_players.values():
+            if remote is best_remote:
+                remote.revive_progress += dt
+                if remote.revive_progress >= 2.3:
+                    remote.downed = False
+                    remote.bleed_out = 0.0
+                    remote.revive_progress = 0.0
+                    remote.health = 40.0
+            else:
+                remote.revive_progress = max(0.0, remote.revive_progress - dt * 1.6)
+
             if remote.downed:
                 remote.bleed_out -= dt
                 if remote.bleed_out <= 0:
@@ -1618,12 +2014,13 @@ class FPSBotArena:
     def update_objective(self, dt: float) -> None:
         if self.objective_type == "defend_zone" and self.objective_zone is not None:
             zx, zy, radius = self.objective_zone
+            radius_sq = radius * radius
             in_zone = False
-            if self.player_health > 0 and not self.player_downed and distance(self.player_x, self.player_y, zx, zy) <= radius:
+            if self.player_health > 0 and not self.player_downed and distance_sq(self.player_x, self.player_y, zx, zy) <= radius_sq:
                 in_zone = True
             if self.net_mode == "host":
                 for remote in self.remote_players.values():
-                    if remote.health > 0 and not remote.downed and distance(remote.x, remote.y, zx, zy) <= radius:
+                    if remote.health > 0 and not remote.downed and distance_sq(remote.x, remote.y, zx, zy) <= radius_sq:
                         in_zone = True
                         break
             if in_zone:
@@ -1635,6 +2032,11 @@ class FPSBotArena:
                 self.award_money("host", reward)
                 self.gain_xp(45 + self.wave * 4)
                 self.bots.clear()
+                # Drop the spatial buckets too: they are rebuilt at the top
+                # of update_bots, which runs after next tick's shooting, so
+                # stale entries would let shots hit the despawned bots.
+                self._bot_grid = {}
+                self._mark_bots_dirty()
                 self.wave_timer = 3.2
         else:
             if self.alive_bots() == 0 and self.wave_cleared_award_pending:
@@ -1705,31 +2107,35 @@ class FPSBotArena:
                     remote.money += add
 
     def update_player_movement(self, dt: float) -> None:
+        keys_state = self.keys_state
         speed = 3.2 * self.get_move_speed_multiplier()
-        if "shift_l" in self.keys or "shift_r" in self.keys:
+        if keys_state[KEY_SHIFT_L] or keys_state[KEY_SHIFT_R]:
             speed = 4.2 * self.get_move_speed_multiplier()
 
+        step = speed * dt
         move_x = 0.0
         move_y = 0.0
         sin_a = math.sin(self.player_angle)
         cos_a = math.cos(self.player_angle)
 
-        if "w" in self.keys:
-            move_x += cos_a * speed * dt
-            move_y += sin_a * speed * dt
-        if "s" in self.keys:
-            move_x -= cos_a * speed * dt
-            move_y -= sin_a * speed * dt
-        if "a" in self.keys:
-            move_x += math.cos(self.player_angle - math.pi / 2) * speed * dt
-            move_y += math.sin(self.player_angle - math.pi / 2) * speed * dt
-        if "d" in self.keys:
-            move_x += math.cos(self.player_angle + math.pi / 2) * speed * dt
-            move_y += math.sin(self.player_angle + math.pi / 2) * speed * dt
-
-        if "left" in self.keys:
+        if keys_state[KEY_W]:
+            move_x += cos_a * step
+            move_y += sin_a * step
+        if keys_state[KEY_S]:
+            move_x -= cos_a * step
+            move_y -= sin_a * step
+        # Same strafe identities as update_remote_players: the forward basis
+        # already encodes the perpendicular.
+        if keys_state[KEY_A]:
+            move_x += sin_a * step
+            move_y -= cos_a * step
+        if keys_state[KEY_D]:
+            move_x -= sin_a * step
+            move_y += cos_a * step
+
+        if keys_state[KEY_LEFT]:
             self.player_angle -= 1.7 * dt
-        if "right" in self.keys:
+        if keys_state[KEY_RIGHT]:
             self.player_angle += 1.7 * dt
 
         self.player_angle = normalize_angle(self.player_angle)
@@ -1744,7 +2150,9 @@ class FPSBotArena:
         if self.can_move(self.player_x, next_y, PLAYER_RADIUS):
             self.player_y = next_y
 
-    def choose_bot_target(self, bot: Bot) -> tuple[str, float, float] | None:
+    def collect_target_candidates(self) -> list[tuple[str, float, float]]:
+        """Alive, non-downed players as (id, x, y); positions are fixed
+        within a tick, so callers build this once and reuse it per bot."""
         candidates: list[tuple[str, float, float]] = []
         if self.player_health > 0 and not self.player_downed:
             candidates.append(("host", self.player_x, self.player_y))
@@ -1752,31 +2160,50 @@ class FPSBotArena:
             for remote in self.remote_players.values():
                 if remote.health > 0 and not remote.downed:
                     candidates.append((remote.player_id, remote.x, remote.y))
-
-        if not candidates:
-            return None
-
-        return min(candidates, key=lambda item: distance(bot.x, bot.y, item[1], item[2]))
+        return candidates
+
+    def choose_bot_target(self, bot: Bot, candidates: list[tuple[str, float, float]]) -> tuple[str, float, float]:
+        bx = bot.x
+        by = bot.y
+        best = candidates[0]
+        best_d_sq = distance_sq(bx, by, best[1], best[2])
+        for candidate in candidates:
+            d_sq = distance_sq(bx, by, candidate[1], candidate[2])
+            if d_sq < best_d_sq:
+                best = candidate
+                best_d_sq = d_sq
+        return best
 
     def update_bots(self, dt: float) -> None:
-        for bot in self.bots:
-            if not bot.alive:
-                continue
-
-            target = self.choose_bot_target(bot)
-            if target is None:
-                continue
-            target_id, target_x, target_y = target
-
+        self._rebuild_bot_grid()
+        candidates = self.collect_target_candidates()
+        if not candidates:
+            return
+        uniform = random.uniform
+        rand = random.random
+        # Current positions by id, so bots keeping a cached target still
+        # chase where that player is this tick.
+        positions = {pid: (px, py) for pid, px, py in candidates}
+        for bot in self.get_alive_bots():
             bot.ai_cooldown -= dt
             bot.fire_cooldown -= dt
 
+            # Re-scan candidates only when the tactic cooldown expires or
+            # the cached target died, went down or disconnected.
+            target_id = bot.target_player_id
+            cached = positions.get(target_id) if bot.ai_cooldown > 0 else None
+            if cached is not None:
+                target_x, target_y = cached
+            else:
+                target_id, target_x, target_y = self.choose_bot_target(bot, candidates)
+                bot.target_player_id = target_id
+
             dist_to_player = distance(bot.x, bot.y, target_x, target_y)
-            has_los = self.line_of_sight(bot.x, bot.y, target_x, target_y)
+            has_los = self._player_bot_los(target_id, target_x, target_y, bot)
 
             if bot.ai_cooldown <= 0:
                 self.assign_bot_tactic(bot, target_x, target_y, has_los, dist_to_player)
-                bot.ai_cooldown = random.uniform(0.65, 1.3)
+                bot.ai_cooldown = uniform(0.65, 1.3)
 
             self.move_bot_toward_target(bot, dt)
 
@@ -1787,7 +2214,7 @@ class FPSBotArena:
                 base_hit += bot.hit_bonus
                 hit_chance = clamp(base_hit, 0.2, 0.84)
 
-                if random.random() < hit_chance:
+                if rand() < hit_chance:
                     dmg = random.randint(bot.damage_min, bot.damage_max) + self.wave // 3
                     if target_id == "host":
                         self.apply_damage_to_host(dmg, bot.x, bot.y)
@@ -1796,7 +2223,7 @@ class FPSBotArena:
                         if remote is not None:
                             self.apply_damage_to_remote(remote, dmg, bot.x, bot.y)
 
-                bot.fire_cooldown = random.uniform(0.45, 1.05)
+                bot.fire_cooldown = uniform(0.45, 1.05)
 
     def assign_bot_tactic(self, bot: Bot, target_x: float, target_y: float, has_los: bool, dist_to_player: float) -> None:
         if bot.kind == "flanker":
@@ -1840,24 +2267,38 @@ class FPSBotArena:
         if not self.cover_points:
             return None
 
-        sample_size = min(24, len(self.cover_points))
-        sample = random.sample(self.cover_points, sample_size)
-        best = None
-        best_score = float("inf")
-
-        for cx, cy in sample:
-            dist_player = distance(cx, cy, target_x, target_y)
-            if dist_player < 2.0 or dist_player > 10.0:
+        # Squared-distance pre-filter over every cover cell first (the map
+        # only holds a few dozen), then LOS — the expensive part — on just
+        # the nearest survivors instead of a random 24-point sample.
+        bx = bot.x
+        by = bot.y
+        shortlist: list[tuple[float, float, float]] = []
+        for cx, cy in self.cover_points:
+            dist_player_sq = distance_sq(cx, cy, target_x, target_y)
+            if dist_player_sq < 4.0 or dist_player_sq > 100.0:
                 continue
-            dist_bot = distance(cx, cy, bot.x, bot.y)
-            if dist_bot > 11.0:
+            dist_bot_sq = distance_sq(cx, cy, bx, by)
+            if dist_bot_sq > 121.0:
                 continue
+            shortlist.append((dist_bot_sq, cx, cy))
+
+        if not shortlist:
+            return None
+        shortlist.sort(key=itemgetter(0))
 
+        best = None
+        best_score = float("inf")
+        for dist_bot_sq, cx, cy in shortlist[:8]:
+            dist_bot = math.sqrt(dist_bot_sq)
             exposed = self.line_of_sight(target_x, target_y, cx, cy)
             score = dist_bot + (4.2 if exposed else 0.0)
             if score < best_score:
                 best_score = score
                 best = (cx, cy)
+            if not exposed:
+                # Sorted by bot distance: no later candidate can score
+                # below an unexposed one already seen.
+                break
 
         return best
 
@@ -1889,7 +2330,7 @@ class FPSBotArena:
             ny = anchor_y + math.sin(angle) * radius
             if not self.can_move(nx, ny, 0.24):
                 continue
-            d = distance(nx, ny, x, y)
+            d = distance_sq(nx, ny, x, y)
             if d < best_dist:
                 best = (nx, ny)
                 best_dist = d
@@ -1899,9 +2340,10 @@ class FPSBotArena:
     def move_bot_toward_target(self, bot: Bot, dt: float) -> None:
         dx = bot.target_x - bot.x
         dy = bot.target_y - bot.y
-        dist = math.hypot(dx, dy)
-        if dist < 0.1:
+        dist_sq = dx * dx + dy * dy
+        if dist_sq < 0.01:
             return
+        dist = math.sqrt(dist_sq)
 
         speed = bot.speed
         if bot.state == "cover":
@@ -1922,6 +2364,12 @@ class FPSBotArena:
             bot.y = ny
 
     def update_drops(self, dt: float) -> None:
+        if not self.money_drops:
+            return
+
+        # One collector sweep shared across drops; the alive/downed filter
+        # used to run again for every single drop on the ground.
+        collectors = self.collect_target_candidates()
         kept: list[MoneyDrop] = []
         for drop in self.money_drops:
             drop.ttl -= dt
@@ -1929,25 +2377,14 @@ class FPSBotArena:
                 continue
 
             collector = None
-            collector_dist = 999.0
-
-            d_local = distance(drop.x, drop.y, self.player_x, self.player_y)
-            if self.player_health > 0 and not self.player_downed and d_local < 0.56:
-                collector = "host"
-                collector_dist = d_local
-
-            if self.net_mode == "host":
-                for remote in self.remote_players.values():
-                    if remote.health <= 0 or remote.downed:
-                        continue
-                    d_remote = distance(drop.x, drop.y, remote.x, remote.y)
-                    if d_remote < 0.56 and d_remote < collector_dist:
-                        collector = remote.player_id
-                        collector_dist = d_remote
-
-            if collector == "host":
-                self.award_money("host", drop.value)
-            elif isinstance(collector, str):
+            collector_dist_sq = 0.56 * 0.56
+            for player_id, px, py in collectors:
+                d_sq = distance_sq(drop.x, drop.y, px, py)
+                if d_sq < collector_dist_sq:
+                    collector = player_id
+                    collector_dist_sq = d_sq
+
+            if collector is not None:
                 self.award_money(collector, drop.value)
             else:
                 kept.append(drop)
@@ -1973,21 +2410,22 @@ class FPSBotArena:
             return
 
         weapon = self.current_weapon
-        config = WEAPON_DATA[weapon]
+        weapon_id = WEAPON_ID[weapon]
+        infinite = WEAPON_INFINITE[weapon_id]
 
-        if not config["infinite"] and self.clip[weapon] <= 0:
+        if not infinite and self.clip[weapon] <= 0:
             self.start_reload(now)
             if self.clip[weapon] <= 0:
                 if self.ammo[weapon] <= 0 and weapon != "pistol":
                     self.current_weapon = "pistol"
                 return
 
-        if not config["infinite"] and self.ammo[weapon] <= 0 and self.clip[weapon] <= 0:
+        if not infinite and self.ammo[weapon] <= 0 and self.clip[weapon] <= 0:
             if weapon != "pistol":
                 self.current_weapon = "pistol"
             return
 
-        self.next_fire_at = now + config["fire_rate"]
+        self.next_fire_at = now + WEAPON_FIRE_RATE[weapon_id]
         self.weapon_kick = 1.0
         flash_scale = 1.0
         if weapon == "shotgun":
@@ -1996,7 +2434,7 @@ class FPSBotArena:
             flash_scale = 1.8
         self.muzzle_flash_timer = max(self.muzzle_flash_timer, 0.12 * flash_scale)
 
-        if not config["infinite"]:
+        if not infinite:
             self.clip[weapon] = max(0, self.clip[weapon] - 1)
 
         if weapon == "rpg":
@@ -2006,28 +2444,36 @@ class FPSBotArena:
 
         spread_mul = self.get_spread_multiplier()
         recoil_mul = self.get_recoil_multiplier()
-        self.spread_heat = min(1.0, self.spread_heat + float(config.get("spread_growth", 0.08)))
-
-        pellets = config["pellets"]
+        self.spread_heat = min(1.0, self.spread_heat + WEAPON_SPREAD_GROWTH[weapon_id])
+
+        # Everything but the recoil sample is invariant across pellets of
+        # one trigger pull; compute once and keep the loop body minimal.
+        recoil_pattern = RECOIL_TABLE[weapon_id]
+        recoil_len = len(recoil_pattern)
+        pellets = WEAPON_PELLETS[weapon_id]
+        recoil_gain = WEAPON_RECOIL_SCALE[weapon_id] * recoil_mul
+        weapon_range = WEAPON_RANGE[weapon_id]
+        shot_spread = WEAPON_SPREAD[weapon_id] * spread_mul * (1.0 + self.spread_heat * 0.8)
+        dmg_base = WEAPON_DAMAGE[weapon_id] * self.get_weapon_damage_multiplier()
+        base_angle = self.player_angle
+        uniform = random.uniform
+        get_first_bot_hit = self.get_first_bot_hit
+        recoil_index = self.recoil_index[weapon_id]
         for _ in range(pellets):
-            recoil_pattern = RECOIL_PATTERNS.get(weapon, [0.0])
-            recoil_offset = recoil_pattern[self.recoil_index[weapon] % len(recoil_pattern)]
-            self.recoil_index[weapon] += 1
-            shot_spread = config["spread"] * spread_mul * (1.0 + self.spread_heat * 0.8)
-            recoil_offset *= float(config.get("recoil_scale", 1.0)) * recoil_mul
-            shot_angle = self.player_angle + recoil_offset + random.uniform(-shot_spread, shot_spread)
-            target, headshot = self.get_first_bot_hit(shot_angle, config["range"])
+            recoil_offset = recoil_pattern[recoil_index % recoil_len] * recoil_gain
+            recoil_index += 1
+            shot_angle = base_angle + recoil_offset + uniform(-shot_spread, shot_spread)
+            target, headshot = get_first_bot_hit(shot_angle, weapon_range)
             if target is None:
                 continue
 
-            dmg = config["damage"] * self.get_weapon_damage_multiplier()
-            if headshot:
-                dmg *= 1.7
+            dmg = dmg_base * 1.7 if headshot else dmg_base
             target.health -= dmg
             if target.health <= 0 and target.alive:
                 self.kill_bot(target, killer_id="host", headshot=headshot)
+        self.recoil_index[weapon_id] = recoil_index
 
-        if not config["infinite"]:
+        if not infinite:
             if self.clip[weapon] <= 0:
                 self.start_reload(now)
             if self.clip[weapon] <= 0 and self.ammo[weapon] <= 0 and weapon != "pistol":
@@ -2039,37 +2485,98 @@ class FPSBotArena:
         origin_y: float,
         shot_angle: float,
         max_range: float,
+        shooter_id: str | None = None,
     ) -> tuple[Bot | None, bool]:
+        grid = self._bot_grid
+        if not grid:
+            return None, False
+
         cos_a = math.cos(shot_angle)
         sin_a = math.sin(shot_angle)
 
-        closest: Bot | None = None
-        headshot = False
-        closest_dist = max_range + 1.0
-
-        for bot in self.bots:
-            if not bot.alive:
-                continue
-
-            dx = bot.x - origin_x
-            dy = bot.y - origin_y
-            along = dx * cos_a + dy * sin_a
-            if along <= 0 or along > max_range:
-                continue
-
-            perp = abs(-sin_a * dx + cos_a * dy)
-            if perp > bot.radius:
-                continue
-
-            if along < closest_dist and self.line_of_sight(origin_x, origin_y, bot.x, bot.y):
-                closest = bot
-                headshot = perp <= bot.radius * 0.4
-                closest_dist = along
+        # Walk the ray cell-by-cell (same DDA stepping as _cast_rays) and only
+        # test bots bucketed along it: any bot whose cylinder crosses the ray
+        # overlaps a visited cell, so skipping the rest of the wave is safe.
+        map_x = int(origin_x)
+        map_y = int(origin_y)
+        delta_dist_x = abs(1.0 / cos_a) if abs(cos_a) > 1e-8 else 1e6
+        delta_dist_y = abs(1.0 / sin_a) if abs(sin_a) > 1e-8 else 1e6
+        if cos_a < 0:
+            step_x = -1
+            side_dist_x = (origin_x - map_x) * delta_dist_x
+        else:
+            step_x = 1
+            side_dist_x = (map_x + 1.0 - origin_x) * delta_dist_x
+        if sin_a < 0:
+            step_y = -1
+            side_dist_y = (origin_y - map_y) * delta_dist_y
+        else:
+            step_y = 1
+            side_dist_y = (map_y + 1.0 - origin_y) * delta_dist_y
+
+        map_w = self.map_w
+        map_h = self.map_h
+
+        # Cheap cylinder tests first, wall walks last: gather every bot the
+        # ray could clip, then run line of sight in near-to-far order and
+        # stop at the first visible one — losing candidates never pay for
+        # a LOS walk.
+        candidates: list[tuple[float, float, Bot]] = []
+        add_candidate = candidates.append
+        tested: set[int] = set()
+        seen = tested.add
+        travelled = 0.0
+        limit = max_range + 0.5
+
+        while travelled <= limit:
+            if map_x < 0 or map_x >= map_w or map_y < 0 or map_y >= map_h:
+                break
+            bucket = grid.get((map_x, map_y))
+            if bucket is not None:
+                for bot in bucket:
+                    bot_key = id(bot)
+                    if bot_key in tested or not bot.alive:
+                        continue
+                    seen(bot_key)
+                    dx = bot.x - origin_x
+                    dy = bot.y - origin_y
+                    along = dx * cos_a + dy * sin_a
+                    if along <= 0 or along > max_range:
+                        continue
+                    perp = -sin_a * dx + cos_a * dy
+                    perp_sq = perp * perp
+                    radius = bot.radius
+                    if perp_sq > radius * radius:
+                        continue
+                    add_candidate((along, perp_sq, bot))
+            # No wall break here: hits are defined as cylinder overlap plus
+            # line of sight to the bot's center, so a bot just past a wall
+            # corner can still be hit and must be collected; the LOS pass
+            # below is what actually rejects bots behind walls.
+            if side_dist_x < side_dist_y:
+                travelled = side_dist_x
+                side_dist_x += delta_dist_x
+                map_x += step_x
+            else:
+                travelled = side_dist_y
+                side_dist_y += delta_dist_y
+                map_y += step_y
 
-        return closest, headshot
+        if not candidates:
+            return None, False
+        if len(candidates) > 1:
+            candidates.sort(key=itemgetter(0))
+        for _along, perp_sq, bot in candidates:
+            if shooter_id is not None:
+                visible = self._player_bot_los(shooter_id, origin_x, origin_y, bot)
+            else:
+                visible = self.line_of_sight(origin_x, origin_y, bot.x, bot.y)
+            if visible:
+                return bot, perp_sq <= bot.radius * bot.radius * 0.16
+        return None, False
 
     def get_first_bot_hit(self, shot_angle: float, max_range: float) -> tuple[Bot | None, bool]:
-        return self.get_first_bot_hit_from(self.player_x, self.player_y, shot_angle, max_range)
+        return self.get_first_bot_hit_from(self.player_x, self.player_y, shot_angle, max_range, shooter_id="host")
 
     def add_player_kill(self, killer_id: str, headshot: bool) -> None:
         if killer_id == "host":
@@ -2088,6 +2595,7 @@ class FPSBotArena:
     def kill_bot(self, bot: Bot, killer_id: str = "host", headshot: bool = False) -> None:
         self.add_player_kill(killer_id, headshot)
         bot.alive = False
+        self._mark_bots_dirty()
         self.gain_xp(int(10 + self.wave * 0.8 + bot.money_multiplier * 4))
         money_count = 1 if random.random() < 0.75 else 2
         for _ in range(money_count):
@@ -2121,12 +2629,12 @@ class FPSBotArena:
                 remote.bleed_out = 0.0
                 remote.revive_progress = 0.0
 
-        reachable_cells = self.get_reachable_floor_cells()
+        spawn_centers = self.get_spawnable_centers()
 
         if self.wave % 4 == 0:
             self.objective_type = "defend_zone"
             self.objective_timer = min(22.0, 11.0 + self.wave * 0.55)
-            zx, zy = self.pick_spawn_far_from_player(reachable_cells)
+            zx, zy = self.pick_spawn_far_from_player(spawn_centers)
             self.objective_zone = (zx, zy, 2.4)
         else:
             self.objective_type = "eliminate"
@@ -2137,12 +2645,23 @@ class FPSBotArena:
             self.gain_xp(14 + self.wave * 2)
 
         for _ in range(spawn_count):
-            x, y = self.pick_spawn_far_from_player(reachable_cells)
-            self.bots.append(self.make_wave_bot(x, y))
+            x, y = self.pick_spawn_far_from_player(spawn_centers)
+            bot = self.make_wave_bot(x, y)
+            self.bots.append(bot)
+            # Register immediately so later picks this wave avoid the spot.
+            self._register_bot_in_grid(bot)
+            self._mark_bots_dirty()
 
         if self.wave % 5 == 0:
-            x, y = self.pick_spawn_far_from_player(reachable_cells)
-            self.bots.append(self.make_wave_bot(x, y, forced_kind="boss"))
+            x, y = self.pick_spawn_far_from_player(spawn_centers)
+            bot = self.make_wave_bot(x, y, forced_kind="boss")
+            self.bots.append(bot)
+            self._register_bot_in_grid(bot)
+            self._mark_bots_dirty()
+
+        # Fresh buckets right away so the new wave is hittable this frame;
+        # update_bots refreshes them every tick after that.
+        self._rebuild_bot_grid()
 
     def make_wave_bot(self, x: float, y: float, forced_kind: str | None = None) -> Bot:
         kind = forced_kind
@@ -2175,53 +2694,50 @@ class FPSBotArena:
             money_multiplier=float(arch["money_mult"]),
         )
 
-    def pick_spawn_far_from_player(self, spawn_cells: list[tuple[int, int]]) -> tuple[float, float]:
+    def pick_spawn_far_from_player(self, spawn_centers: list[tuple[float, float]]) -> tuple[float, float]:
+        # Occupancy via the bot grid: a bot within 0.8 of a cell center is
+        # always bucketed in that cell (per-axis reach from the center is
+        # 0.5 + radius + drift margin = 0.93), so one bucket lookup replaces
+        # a scan over every alive bot per candidate.
+        grid = self._bot_grid
         candidates: list[tuple[float, float, float]] = []
-        for cell_x, cell_y in spawn_cells:
-            x = cell_x + 0.5
-            y = cell_y + 0.5
-            if not self.can_move(x, y, 0.24):
+        for x, y in spawn_centers:
+            bucket = grid.get((int(x), int(y)))
+            if bucket is not None and any(
+                distance_sq(x, y, b.x, b.y) < 0.8 * 0.8 for b in bucket
+            ):
                 continue
 
-            blocked = any(distance(x, y, b.x, b.y) < 0.8 for b in self.bots if b.alive)
-            if blocked:
-                continue
-
-            dist = distance(x, y, self.player_x, self.player_y)
-            candidates.append((x, y, dist))
+            dist_sq = distance_sq(x, y, self.player_x, self.player_y)
+            candidates.append((x, y, dist_sq))
 
         if not candidates:
             relaxed: list[tuple[float, float, float]] = []
-            for cell_x, cell_y in spawn_cells:
-                x = cell_x + 0.5
-                y = cell_y + 0.5
-                if not self.can_move(x, y, 0.24):
-                    continue
-                blocked = any(distance(x, y, b.x, b.y) < 0.35 for b in self.bots if b.alive)
-                if blocked:
+            for x, y in spawn_centers:
+                bucket = grid.get((int(x), int(y)))
+                if bucket is not None and any(
+                    distance_sq(x, y, b.x, b.y) < 0.35 * 0.35 for b in bucket
+                ):
                     continue
-                relaxed.append((x, y, distance(x, y, self.player_x, self.player_y)))
+                relaxed.append((x, y, distance_sq(x, y, self.player_x, self.player_y)))
 
             if relaxed:
-                far_relaxed = [item for item in relaxed if item[2] >= 6.5]
+                far_relaxed = [item for item in relaxed if item[2] >= 6.5 * 6.5]
                 if far_relaxed:
                     x, y, _ = random.choice(far_relaxed)
                     return x, y
                 x, y, _ = max(relaxed, key=lambda item: item[2])
                 return x, y
 
-            fallback: list[tuple[float, float, float]] = []
-            for cell_x, cell_y in spawn_cells:
-                x = cell_x + 0.5
-                y = cell_y + 0.5
-                if self.can_move(x, y, 0.24):
-                    fallback.append((x, y, distance(x, y, self.player_x, self.player_y)))
+            fallback: list[tuple[float, float, float]] = [
+                (x, y, distance_sq(x, y, self.player_x, self.player_y)) for x, y in spawn_centers
+            ]
             if fallback:
                 x, y, _ = max(fallback, key=lambda item: item[2])
                 return x, y
             return self.player_x, self.player_y
 
-        far_candidates = [item for item in candidates if item[2] >= 6.5]
+        far_candidates = [item for item in candidates if item[2] >= 6.5 * 6.5]
         if far_candidates:
             x, y, _ = random.choice(far_candidates)
             return x, y
@@ -2230,101 +2746,243 @@ class FPSBotArena:
         x, y, _ = max(candidates, key=lambda item: item[2])
         return x, y
 
+    def _mark_bots_dirty(self) -> None:
+        self._bots_dirty = True
+
+    def get_alive_bots(self) -> list[Bot]:
+        if self._bots_dirty:
+            self._alive_bots = [bot for bot in self.bots if bot.alive]
+            self._bots_dirty = False
+        return self._alive_bots
+
+    def _rebuild_bot_grid(self) -> None:
+        # Bots bucketed into every map cell their hit cylinder overlaps
+        # (plus a margin for one frame of drift), so a shot ray only tests
+        # the buckets along its own path instead of scanning the whole wave.
+        self._bot_grid = {}
+        register = self._register_bot_in_grid
+        for bot in self.get_alive_bots():
+            register(bot)
+
+    def _register_bot_in_grid(self, bot: Bot) -> None:
+        grid = self._bot_grid
+        reach = bot.radius + 0.15
+        x0 = int(bot.x - reach)
+        x1 = int(bot.x + reach)
+        y0 = int(bot.y - reach)
+        y1 = int(bot.y + reach)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket is None:
+                    grid[(cx, cy)] = [bot]
+                else:
+                    bucket.append(bot)
+
     def alive_bots(self) -> int:
-        return sum(1 for bot in self.bots if bot.alive)
+        return len(self.get_alive_bots())
 
     def is_wall(self, x: float, y: float) -> bool:
         ix = int(x)
         iy = int(y)
-        if iy < 0 or iy >= len(WORLD_MAP) or ix < 0 or ix >= len(WORLD_MAP[0]):
+        if iy < 0 or iy >= self.map_h or ix < 0 or ix >= self.map_w:
             return True
-        return WORLD_MAP[iy][ix] == "#"
+        return bool((self.wall_bits[iy] >> ix) & 1)
 
     def can_move(self, x: float, y: float, radius: float) -> bool:
-        tests = [
-            (x - radius, y - radius),
-            (x + radius, y - radius),
-            (x - radius, y + radius),
-            (x + radius, y + radius),
-        ]
-        for px, py in tests:
-            if self.is_wall(px, py):
-                return False
-        return True
+        # The four corner probes share two columns and two rows; test the
+        # wall bits directly instead of building a tuple list and paying
+        # four is_wall calls per movement axis.
+        x0 = int(x - radius)
+        x1 = int(x + radius)
+        y0 = int(y - radius)
+        y1 = int(y + radius)
+        if x0 < 0 or y0 < 0 or x1 >= self.map_w or y1 >= self.map_h:
+            return False
+        wall_bits = self.wall_bits
+        row = wall_bits[y0]
+        if (row >> x0) & 1 or (row >> x1) & 1:
+            return False
+        row = wall_bits[y1]
+        return not ((row >> x0) & 1 or (row >> x1) & 1)
+
+    def _player_bot_los(self, player_id: str, px: float, py: float, bot: Bot) -> bool:
+        """Line of sight between a player and a bot, memoized per tick.
+
+        Both endpoints are fixed within a frame, so repeat queries for the
+        same pair (every pellet of a shotgun blast, the AI pass after a
+        shot) reuse one wall walk. The cache is cleared in update().
+        """
+        key = (player_id, id(bot))
+        cached = self._los_cache.get(key)
+        if cached is None:
+            cached = self.line_of_sight(px, py, bot.x, bot.y)
+            self._los_cache[key] = cached
+        return cached
 
     def line_of_sight(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        # Cell-stepping DDA like _cast_rays: one wall-bit test per crossed
+        # cell instead of fixed 0.08-unit samples along the segment, and
+        # exact — a thin wall clipped between two samples can't slip by.
         dx = x2 - x1
         dy = y2 - y1
         dist = math.hypot(dx, dy)
         if dist < 0.01:
             return True
+        cos_a = dx / dist
+        sin_a = dy / dist
 
-        steps = max(1, int(dist / 0.08))
-        for i in range(1, steps):
-            t = i / steps
-            x = x1 + dx * t
-            y = y1 + dy * t
-            if self.is_wall(x, y):
-                return False
-        return True
-
-    def cast_ray(self, angle: float) -> tuple[float, int, int, int]:
-        px = self.player_x
-        py = self.player_y
-        sin_a = math.sin(angle)
-        cos_a = math.cos(angle)
-
-        map_x = int(px)
-        map_y = int(py)
-
+        map_x = int(x1)
+        map_y = int(y1)
         delta_dist_x = abs(1.0 / cos_a) if abs(cos_a) > 1e-8 else 1e6
         delta_dist_y = abs(1.0 / sin_a) if abs(sin_a) > 1e-8 else 1e6
-
         if cos_a < 0:
             step_x = -1
-            side_dist_x = (px - map_x) * delta_dist_x
+            side_dist_x = (x1 - map_x) * delta_dist_x
         else:
             step_x = 1
-            side_dist_x = (map_x + 1.0 - px) * delta_dist_x
-
+            side_dist_x = (map_x + 1.0 - x1) * delta_dist_x
         if sin_a < 0:
             step_y = -1
-            side_dist_y = (py - map_y) * delta_dist_y
+            side_dist_y = (y1 - map_y) * delta_dist_y
         else:
             step_y = 1
-            side_dist_y = (map_y + 1.0 - py) * delta_dist_y
-
-        side = 0
-        dist = MAX_DEPTH
+            side_dist_y = (map_y + 1.0 - y1) * delta_dist_y
 
-        for _ in range(160):
+        wall_bits = self.wall_bits
+        map_w = self.map_w
+        map_h = self.map_h
+        while True:
             if side_dist_x < side_dist_y:
-                map_x += step_x
-                dist = side_dist_x
+                if side_dist_x >= dist:
+                    return True
                 side_dist_x += delta_dist_x
-                side = 0
+                map_x += step_x
             else:
-                map_y += step_y
-                dist = side_dist_y
+                if side_dist_y >= dist:
+                    return True
                 side_dist_y += delta_dist_y
-                side = 1
+                map_y += step_y
+            if map_x < 0 or map_x >= map_w or map_y < 0 or map_y >= map_h:
+                return False
+            if (wall_bits[map_y] >> map_x) & 1:
+                return False
+
+    def _rebuild_ray_table(self) -> None:
+        """Precompute per-column angle-offset trig, keyed on (FOV, RAY_COUNT).
+
+        The offsets from the view axis are fixed until the FOV or ray count
+        changes, so each frame only needs one sin/cos of the player angle;
+        per-ray directions come from the angle-sum identities, and the cosine
+        of the offset doubles as the fisheye correction factor.
+        """
+        step = FOV / RAY_COUNT
+        offsets = [-FOV / 2 + i * step for i in range(RAY_COUNT)]
+        self._ray_cos_off = [math.cos(offset) for offset in offsets]
+        self._ray_sin_off = [math.sin(offset) for offset in offsets]
+        # Pre-zipped pairs so the per-frame loop iterates a ready list
+        # instead of rebuilding a tuple per ray through zip().
+        self._ray_off_pairs = list(zip(self._ray_cos_off, self._ray_sin_off))
+        self._ray_table_key = (FOV, RAY_COUNT)
+
+    def _cast_rays(self) -> list[tuple[float, float, int, int, int, float, float]]:
+        """Cast every view ray for the current frame in a single pass.
+
+        Inlines the DDA stepping loop over the numeric wall grid and keeps
+        trig functions and grid rows in locals, so per-ray overhead stays
+        flat as RAY_COUNT grows. Each entry is (corrected_dist, dist, side,
+        map_x, map_y, cos_a, sin_a).
+        """
+        if self._ray_table_key != (FOV, RAY_COUNT):
+            self._rebuild_ray_table()
 
-            if dist > MAX_DEPTH:
-                return MAX_DEPTH, side, map_x, map_y
+        px = self.player_x
+        py = self.player_y
+        cos_p = math.cos(self.player_angle)
+        sin_p = math.sin(self.player_angle)
+        grid = self.wall_bits
+        map_h = self.map_h
+        map_w = self.map_w
+        max_depth = MAX_DEPTH
+        _abs = abs
+        rays: list[tuple[float, float, int, int, int, float, float]] = []
+        append = rays.append
+
+        # Start-cell values are ray-independent; compute them once per frame.
+        start_x = int(px)
+        start_y = int(py)
+        frac_left = px - start_x
+        frac_right = start_x + 1.0 - px
+        frac_up = py - start_y
+        frac_down = start_y + 1.0 - py
+        start_row = grid[start_y]
+
+        for cos_off, sin_off in self._ray_off_pairs:
+            cos_a = cos_p * cos_off - sin_p * sin_off
+            sin_a = sin_p * cos_off + cos_p * sin_off
+
+            map_x = start_x
+            map_y = start_y
+            row = start_row
+
+            delta_dist_x = _abs(1.0 / cos_a) if _abs(cos_a) > 1e-8 else 1e6
+            delta_dist_y = _abs(1.0 / sin_a) if _abs(sin_a) > 1e-8 else 1e6
+
+            if cos_a < 0:
+                step_x = -1
+                side_dist_x = frac_left * delta_dist_x
+            else:
+                step_x = 1
+                side_dist_x = frac_right * delta_dist_x
 
-            if map_y < 0 or map_y >= len(WORLD_MAP) or map_x < 0 or map_x >= len(WORLD_MAP[0]):
-                return MAX_DEPTH, side, map_x, map_y
+            if sin_a < 0:
+                step_y = -1
+                side_dist_y = frac_up * delta_dist_y
+            else:
+                step_y = 1
+                side_dist_y = frac_down * delta_dist_y
+
+            # The unchanged axis was bounds-checked on its last step, so each
+            # branch only validates the coordinate it moved, and the grid row
+            # is re-fetched only on vertical steps.
+            side = 0
+            dist = max_depth
+            for _ in range(160):
+                if side_dist_x < side_dist_y:
+                    map_x += step_x
+                    dist = side_dist_x
+                    side_dist_x += delta_dist_x
+                    side = 0
+                    if dist > max_depth or map_x < 0 or map_x >= map_w:
+                        dist = max_depth
+                        break
+                    if (row >> map_x) & 1:
+                        break
+                else:
+                    map_y += step_y
+                    dist = side_dist_y
+                    side_dist_y += delta_dist_y
+                    side = 1
+                    if dist > max_depth or map_y < 0 or map_y >= map_h:
+                        dist = max_depth
+                        break
+                    row = grid[map_y]
+                    if (row >> map_x) & 1:
+                        break
+            else:
+                dist = max_depth
 
-            if WORLD_MAP[map_y][map_x] == "#":
-                return dist, side, map_x, map_y
+            append((dist * cos_off, dist, side, map_x, map_y, cos_a, sin_a))
 
-        return MAX_DEPTH, side, map_x, map_y
+        return rays
 
     def shop_slot_from_mouse(self) -> int | None:
         cx = WIDTH // 2
         cy = HALF_HEIGHT
-        dx = self.last_mouse_x - cx
-        dy = self.last_mouse_y - cy
+        mouse_x = self.canvas.winfo_pointerx() - self.canvas.winfo_rootx()
+        mouse_y = self.canvas.winfo_pointery() - self.canvas.winfo_rooty()
+        dx = mouse_x - cx
+        dy = mouse_y - cy
         radius = math.hypot(dx, dy)
 
         if radius < 60 or radius > 230:
@@ -2338,12 +2996,24 @@ class FPSBotArena:
         return slot
 
     def render(self, now: float) -> None:
-        self.canvas.delete("all")
-        self.pause_hitboxes = []
+        # Wipe only last frame's items: tag everything, untag the persistent
+        # backdrop, delete the rest. Three Tcl calls regardless of item count.
+        canvas = self.canvas
+        canvas.addtag_all("frame")
+        canvas.dtag("static", "frame")
+        canvas.dtag("hud", "frame")
+        canvas.dtag("viewmodel", "frame")
+        canvas.dtag("wbar", "frame")
+        canvas.dtag("bsod", "frame")
+        canvas.dtag("deadover", "frame")
+        canvas.delete("frame")
 
         if self.game_state == "bsod":
             self.render_bsod(now)
             return
+        if self._bsod_visible:
+            self._bsod_visible = False
+            canvas.itemconfigure("bsod", state="hidden")
 
         self.render_world()
         self.render_sprites()
@@ -2352,10 +3022,13 @@ class FPSBotArena:
 
         if self.game_state == "glitch":
             self.render_glitch_overlay()
-        elif self.game_state == "dead":
+        if self.game_state == "dead":
             self.render_dead_overlay()
+        elif self._dead_visible:
+            self._dead_visible = False
+            canvas.itemconfigure("deadover", state="hidden")
 
-        if not self.pause_open and "tab" in self.keys:
+        if not self.pause_open and self.keys_state[KEY_TAB]:
             self.render_scoreboard_overlay()
 
         if self.pause_open:
@@ -2368,6 +3041,24 @@ class FPSBotArena:
         b2 = int(a[2] + (b[2] - a[2]) * t)
         return (r, g, b2)
 
+    def _eval_batch(self, commands: list[str]) -> None:
+        """Create several canvas items with a single Tcl eval.
+
+        Each entry is the argument tail of a canvas subcommand, e.g.
+        "create rectangle 0 0 4 4 -fill #fff". Joining them into one
+        script crosses the Python/Tcl boundary once instead of once per
+        item, which matters for panels that redraw many items per frame.
+        """
+        path = self._canvas_path
+        self.canvas.tk.eval(";".join(f"{path} {cmd}" for cmd in commands))
+
+    def _font(self, size: int, bold: bool = True) -> tkfont.Font:
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(family="Consolas", size=size, weight="bold" if bold else "normal")
+        return font
+
     def draw_ui_panel(
         self,
         x1: float,
@@ -2376,9 +3067,10 @@ class FPSBotArena:
         y2: float,
         fill: str = "#101722",
         outline: str = "#5f7899",
+        tags: str = "",
     ) -> None:
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=2)
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill="#0b1119", outline="", stipple="gray50")
+        self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=2, tags=tags)
+        self.canvas.create_rectangle(x1, y1, x2, y2, fill="#0b1119", outline="", stipple="gray50", tags=tags)
 
     def sample_wall_color(
         self,
@@ -2388,8 +3080,20 @@ class FPSBotArena:
         corrected_dist: float,
         side: int,
     ) -> str:
-        tex_u = tex_u % 1.0
+        # Quantize the texture coordinate to 1/24 tile and distance to
+        # 0.25-unit bands: invisible at slice width, but neighbouring
+        # slices now repeat exact colors, so render_world's run merging
+        # collapses them and the hex string itself becomes cacheable.
         tile = abs(map_x * 17 + map_y * 23) % len(self.wall_palette)
+        band_u = int((tex_u % 1.0) * 24.0)
+        band_d = int(corrected_dist * 4.0)
+        key = (tile, band_u, band_d, side)
+        cached = self._wall_color_cache.get(key)
+        if cached is not None:
+            return cached
+
+        tex_u = (band_u + 0.5) / 24.0
+        corrected_dist = (band_d + 0.5) * 0.25
         base_r, base_g, base_b = self.wall_palette[tile]
 
         grain = 0.9 + 0.14 * math.sin(tex_u * math.tau * 6.0 + tile * 0.8)
@@ -2407,9 +3111,40 @@ class FPSBotArena:
         r = int(clamp(lit_r * (1.0 - fog) + fog_r * fog, 18, 245))
         g = int(clamp(lit_g * (1.0 - fog) + fog_g * fog, 18, 245))
         b = int(clamp(lit_b * (1.0 - fog) + fog_b * fog, 18, 245))
-        return rgb(r, g, b)
+        color = rgb(r, g, b)
+        self._wall_color_cache[key] = color
+        return color
+
+    def _build_overlay_images(self) -> None:
+        """(Re)build the full-screen 50%-dim overlay images per resolution.
+
+        PhotoImage has no alpha channel, so the gray50 stipple look is
+        reproduced with a 2x2 checkerboard tile (two tinted pixels, two
+        transparent) zoomed to screen size. Drawing an overlay is then a
+        single image blit instead of Tk walking the stipple pattern across
+        the whole screen every frame the overlay is up.
+        """
+        self._overlay_images = {}
+        for name, color in _OVERLAY_COLORS.items():
+            tile = tk.PhotoImage(width=2, height=2)
+            tile.put(color, to=(0, 0, 2, 2))
+            tile.transparency_set(0, 1, True)
+            tile.transparency_set(1, 0, True)
+            self._overlay_images[name] = tile.zoom((WIDTH + 1) // 2, (HEIGHT + 1) // 2)
+
+    def _draw_overlay(self, name: str) -> None:
+        self.canvas.create_image(0, 0, anchor="nw", image=self._overlay_images[name])
+
+    def _build_static_backdrop(self) -> None:
+        """(Re)create the sky/floor gradient items once instead of per frame.
+
+        Everything here is tagged "static" and survives the frame wipe in
+        render(); the only per-frame work left for the backdrop is sliding
+        the star x coordinates for the view parallax.
+        """
+        canvas = self.canvas
+        canvas.delete("static")
 
-    def render_world(self) -> None:
         ceiling_steps = 14
         for i in range(ceiling_steps):
             t = i / max(1, ceiling_steps - 1)
@@ -2418,14 +3153,15 @@ class FPSBotArena:
             r, g, b = self.mix_rgb(top, bottom, t)
             y1 = int(i * HALF_HEIGHT / ceiling_steps)
             y2 = int((i + 1) * HALF_HEIGHT / ceiling_steps) + 1
-            self.canvas.create_rectangle(0, y1, WIDTH, y2, fill=rgb(r, g, b), outline="")
+            canvas.create_rectangle(0, y1, WIDTH, y2, fill=rgb(r, g, b), outline="", tags="static")
 
-        parallax = (self.player_angle / math.tau) * 0.35
+        self._star_ids: list[int] = []
         for sx, sy, size, brightness in self.sky_stars:
-            star_x = int(((sx + parallax) % 1.0) * WIDTH)
             star_y = int(sy * HALF_HEIGHT * 0.9)
             color = rgb(brightness, brightness, min(255, brightness + 20))
-            self.canvas.create_rectangle(star_x, star_y, star_x + size, star_y + size, fill=color, outline="")
+            self._star_ids.append(
+                canvas.create_rectangle(0, star_y, size, star_y + size, fill=color, outline="", tags="static")
+            )
 
         floor_steps = 18
         for i in range(floor_steps):
@@ -2435,13 +3171,21 @@ class FPSBotArena:
             r, g, b = self.mix_rgb(top, bottom, t)
             y1 = HALF_HEIGHT + int(i * (HEIGHT - HALF_HEIGHT) / floor_steps)
             y2 = HALF_HEIGHT + int((i + 1) * (HEIGHT - HALF_HEIGHT) / floor_steps) + 1
-            self.canvas.create_rectangle(0, y1, WIDTH, y2, fill=rgb(r, g, b), outline="")
+            canvas.create_rectangle(0, y1, WIDTH, y2, fill=rgb(r, g, b), outline="", tags="static")
 
         for row in range(1, 10):
             t = row / 10.0
             y = HALF_HEIGHT + int((t**1.9) * (HEIGHT - HALF_HEIGHT))
             line_shade = int(clamp(58 - t * 34, 16, 58))
-            self.canvas.create_line(0, y, WIDTH, y, fill=rgb(line_shade, line_shade - 8, line_shade - 10), width=1)
+            canvas.create_line(0, y, WIDTH, y, fill=rgb(line_shade, line_shade - 8, line_shade - 10), width=1, tags="static")
+
+    def render_world(self) -> None:
+        parallax = (self.player_angle / math.tau) * 0.35
+        coords = self.canvas.coords
+        for (sx, sy, size, _brightness), item in zip(self.sky_stars, self._star_ids):
+            star_x = int(((sx + parallax) % 1.0) * WIDTH)
+            star_y = int(sy * HALF_HEIGHT * 0.9)
+            coords(item, star_x, star_y, star_x + size, star_y + size)
 
         lane_spacing = max(52, WIDTH // 16)
         lane_offset = int((self.player_angle / math.tau) * lane_spacing)
@@ -2450,47 +3194,75 @@ class FPSBotArena:
             self.canvas.create_line(lane_x, HALF_HEIGHT + 3, end_x, HEIGHT, fill="#25211f", width=1)
 
         slice_width = WIDTH / RAY_COUNT
-        self.zbuffer: list[float] = []
-
-        for i in range(RAY_COUNT):
-            ray_angle = self.player_angle - FOV / 2 + (i / RAY_COUNT) * FOV
-            dist, side, map_x, map_y = self.cast_ray(ray_angle)
-
-            corrected = dist * math.cos(ray_angle - self.player_angle)
+        # Reuse the z-buffer between frames; it only reallocates when the
+        # adaptive quality controller changes the ray count.
+        zbuffer = self.zbuffer
+        if len(zbuffer) != RAY_COUNT:
+            zbuffer = self.zbuffer = [0.0] * RAY_COUNT
+        create_rectangle = self.canvas.create_rectangle
+
+        # Merge runs of adjacent slices with identical geometry and color
+        # into one rectangle; each canvas call is a Tcl round-trip.
+        run_color: str | None = None
+        run_x1 = run_x2 = 0.0
+        run_y1 = run_y2 = 0
+
+        for i, (corrected, dist, side, map_x, map_y, cos_a, sin_a) in enumerate(self._cast_rays()):
             corrected = max(0.0001, corrected)
-            self.zbuffer.append(corrected)
+            zbuffer[i] = corrected
 
             proj_height = int((HEIGHT * 0.95) / corrected)
             proj_height = min(HEIGHT, proj_height)
-            hit_x = self.player_x + math.cos(ray_angle) * dist
-            hit_y = self.player_y + math.sin(ray_angle) * dist
+            hit_x = self.player_x + cos_a * dist
+            hit_y = self.player_y + sin_a * dist
             tex_u = (hit_y - math.floor(hit_y)) if side == 0 else (hit_x - math.floor(hit_x))
             color = self.sample_wall_color(map_x, map_y, tex_u, corrected, side)
             x1 = i * slice_width
             x2 = x1 + slice_width + 1
             y1 = HALF_HEIGHT - proj_height // 2
             y2 = HALF_HEIGHT + proj_height // 2
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
 
-    def render_sprites(self) -> None:
-        items: list[tuple[float, str, object]] = []
+            if color == run_color and y1 == run_y1 and y2 == run_y2:
+                run_x2 = x2
+                continue
+            if run_color is not None:
+                create_rectangle(run_x1, run_y1, run_x2, run_y2, fill=run_color, outline="")
+            run_color = color
+            run_x1, run_x2, run_y1, run_y2 = x1, x2, y1, y2
 
-        for bot in self.bots:
-            if bot.alive:
-                d = distance(bot.x, bot.y, self.player_x, self.player_y)
-                items.append((d, "bot", bot))
+        if run_color is not None:
+            create_rectangle(run_x1, run_y1, run_x2, run_y2, fill=run_color, outline="")
+
+    def render_sprites(self) -> None:
+        px = self.player_x
+        py = self.player_y
+        # Each entry carries its world position so the projection loop below
+        # reads tuple slots instead of re-dispatching per-kind attribute or
+        # dict lookups for every object every frame. Distances stay squared
+        # until a sprite survives the view-cone gate: the ordering is the
+        # same and culled objects never pay the sqrt.
+        items: list[tuple[float, str, object, float, float]] = []
+        append = items.append
+
+        for bot in self.get_alive_bots():
+            bx = bot.x
+            by = bot.y
+            dx = bx - px
+            dy = by - py
+            append((dx * dx + dy * dy, "bot", bot, bx, by))
 
         for drop in self.money_drops:
-            d = distance(drop.x, drop.y, self.player_x, self.player_y)
-            items.append((d, "money", drop))
+            dx = drop.x - px
+            dy = drop.y - py
+            append((dx * dx + dy * dy, "money", drop, drop.x, drop.y))
 
         if self.team_ping is not None:
-            d = distance(self.team_ping[0], self.team_ping[1], self.player_x, self.player_y)
-            items.append((d, "ping", {"x": self.team_ping[0], "y": self.team_ping[1], "owner": self.team_ping[3]}))
+            ping_x, ping_y = self.team_ping[0], self.team_ping[1]
+            append((distance_sq(ping_x, ping_y, px, py), "ping", self.team_ping[3], ping_x, ping_y))
 
         if self.objective_type == "defend_zone" and self.objective_zone is not None:
-            d = distance(self.objective_zone[0], self.objective_zone[1], self.player_x, self.player_y)
-            items.append((d, "objective", {"x": self.objective_zone[0], "y": self.objective_zone[1]}))
+            zone_x, zone_y = self.objective_zone[0], self.objective_zone[1]
+            append((distance_sq(zone_x, zone_y, px, py), "objective", None, zone_x, zone_y))
 
         teammates: list[TeammateView] = []
         if self.net_mode == "host":
@@ -2515,139 +3287,219 @@ class FPSBotArena:
             teammates = list(self.remote_render_players)
 
         for teammate in teammates:
-            d = distance(teammate.x, teammate.y, self.player_x, self.player_y)
-            if d < 0.35:
+            tx = teammate.x
+            ty = teammate.y
+            dx = tx - px
+            dy = ty - py
+            d_sq = dx * dx + dy * dy
+            if d_sq < 0.35 * 0.35:
                 continue
-            items.append((d, "human", teammate))
-
-        items.sort(key=lambda item: item[0], reverse=True)
-
-        for dist, kind, obj in items:
-            obj_x = obj.x if hasattr(obj, "x") else float(obj["x"])
-            obj_y = obj.y if hasattr(obj, "y") else float(obj["y"])
-            dx = obj_x - self.player_x
-            dy = obj_y - self.player_y
-            theta = normalize_angle(math.atan2(dy, dx) - self.player_angle)
-
-            if theta > math.pi:
-                theta -= math.tau
-
-            if abs(theta) > FOV * 0.58:
+            append((d_sq, "human", teammate, tx, ty))
+
+        # itemgetter keys sort in C; a lambda key re-enters the interpreter
+        # once per comparison element.
+        items.sort(key=itemgetter(0), reverse=True)
+
+        # Far-to-near order puts the keepers at the tail: when the adaptive
+        # budget is tight, the farthest (least visible) sprites are shed.
+        if len(items) > self.sprite_budget:
+            items = items[-self.sprite_budget :]
+
+        # Angle gate without atan2: abs(theta) <= FOV*0.58 is equivalent to
+        # the forward component dx*cos+dy*sin >= dist*cos(FOV*0.58), so
+        # objects behind or far outside the view cone are culled with a few
+        # multiplies and the transcendental (and the sqrt for the real
+        # distance) only runs for sprites that pass.
+        player_angle = self.player_angle
+        cos_p = math.cos(player_angle)
+        sin_p = math.sin(player_angle)
+        cos_gate = math.cos(FOV * 0.58)
+        cos_gate_sq = cos_gate * cos_gate
+        atan2 = math.atan2
+        sqrt = math.sqrt
+        # Height coefficients are per-frame invariants (HEIGHT only changes
+        # with the resolution); keep them out of the per-sprite branches.
+        bot_h_coef = HEIGHT * 0.72
+        human_h_coef = HEIGHT * 0.7
+        money_h_coef = HEIGHT * 0.22
+        ping_size_coef = HEIGHT * 0.16
+        zone_size_coef = HEIGHT * 0.2
+        # Reciprocal multiplications and local aliases of the render
+        # globals: the projection below runs per visible sprite and should
+        # not pay a division or a global lookup per use.
+        width = WIDTH
+        half_height = HALF_HEIGHT
+        inv_fov = 1.0 / FOV
+        ray_over_width = RAY_COUNT / width
+        zbuffer = self.zbuffer
+        zbuffer_len = len(zbuffer)
+        create_rectangle = self.canvas.create_rectangle
+        create_oval = self.canvas.create_oval
+        create_text = self.canvas.create_text
+        pi = math.pi
+        tau = math.tau
+
+        for dist_sq, kind, obj, obj_x, obj_y in items:
+            dx = obj_x - px
+            dy = obj_y - py
+            forward = dx * cos_p + dy * sin_p
+            if forward < 0.0 or forward * forward < dist_sq * cos_gate_sq:
                 continue
+            dist = sqrt(dist_sq)
+
+            # normalize_angle inlined: one call frame per drawn sprite adds
+            # up, and the wrap is a single modulo anyway.
+            theta = (atan2(dy, dx) - player_angle) % tau
+            if theta > pi:
+                theta -= tau
 
-            screen_x = (0.5 + theta / FOV) * WIDTH
-            col = int((screen_x / WIDTH) * RAY_COUNT)
-            if col < 0 or col >= len(self.zbuffer):
+            screen_x = (0.5 + theta * inv_fov) * width
+            col = int(screen_x * ray_over_width)
+            if col < 0 or col >= zbuffer_len:
                 continue
 
-            if dist > self.zbuffer[col] + 0.12:
+            if dist > zbuffer[col] + 0.12:
                 continue
 
             if kind == "bot":
                 bot = obj
-                size_scale = 1.0
-                if bot.kind == "tank":
-                    size_scale = 1.18
-                elif bot.kind == "boss":
-                    size_scale = 1.34
-                elif bot.kind == "flanker":
-                    size_scale = 0.92
-                h = int((HEIGHT * 0.72 * size_scale) / max(0.15, dist))
-                w = int(h * 0.48)
-                x1 = screen_x - w / 2
-                y1 = HALF_HEIGHT - h / 2
-                x2 = screen_x + w / 2
-                y2 = HALF_HEIGHT + h / 2
-
-                body = "#d64a4a"
-                if bot.kind == "flanker":
-                    body = "#dc8750"
-                elif bot.kind == "tank":
-                    body = "#7b5ad0"
-                elif bot.kind == "sharpshooter":
-                    body = "#49a2d6"
-                elif bot.kind == "boss":
-                    body = "#f04d9d"
+                size_scale, body = BOT_VISUAL.get(bot.kind, BOT_VISUAL["grunt"])
                 if bot.state == "cover":
-                    body = "#c28a3e"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=body, outline="#101116", width=2)
+                    body = BOT_COVER_COLOR
+                h = int(bot_h_coef * size_scale / (0.15 if dist < 0.15 else dist))
+                if h < SPRITE_LOD_DOT_H:
+                    create_rectangle(screen_x - 1, half_height - h * 0.5, screen_x + 1, half_height + h * 0.5, fill=body, outline="")
+                    continue
+                w = int(h * 0.48)
+                x1 = screen_x - w * 0.5
+                y1 = half_height - h * 0.5
+                x2 = screen_x + w * 0.5
+                y2 = half_height + h * 0.5
+                create_rectangle(x1, y1, x2, y2, fill=body, outline="#101116", width=2)
+                if h < SPRITE_LOD_BODY_H:
+                    continue
                 head_h = h * 0.28
-                self.canvas.create_oval(x1 + w * 0.2, y1 - head_h * 0.6, x2 - w * 0.2, y1 + head_h * 0.7, fill="#e4b7a0", outline="")
+                create_oval(x1 + w * 0.2, y1 - head_h * 0.6, x2 - w * 0.2, y1 + head_h * 0.7, fill="#e4b7a0", outline="")
                 arch = BOT_ARCHETYPES.get(bot.kind, BOT_ARCHETYPES["grunt"])
                 hp_cap = max(1.0, (65 + self.wave * 7) * float(arch["hp_mult"]))
                 hp_ratio = clamp(bot.health / hp_cap, 0.0, 1.0)
                 bar_w = max(28, int(w * 1.08))
-                bar_x1 = screen_x - bar_w / 2
-                bar_x2 = screen_x + bar_w / 2
+                bar_x1 = screen_x - bar_w * 0.5
+                bar_x2 = screen_x + bar_w * 0.5
                 bar_y1 = y1 - 18
-                self.canvas.create_rectangle(bar_x1, bar_y1, bar_x2, bar_y1 + 7, fill="#191d24", outline="")
-                self.canvas.create_rectangle(bar_x1, bar_y1, bar_x1 + bar_w * hp_ratio, bar_y1 + 7, fill="#e96f62", outline="")
+                create_rectangle(bar_x1, bar_y1, bar_x2, bar_y1 + 7, fill="#191d24", outline="")
+                create_rectangle(bar_x1, bar_y1, bar_x1 + bar_w * hp_ratio, bar_y1 + 7, fill="#e96f62", outline="")
             elif kind == "human":
                 teammate = obj
-                h = int((HEIGHT * 0.7) / max(0.15, dist))
+                h = int(human_h_coef / (0.15 if dist < 0.15 else dist))
                 w = int(h * 0.46)
-                x1 = screen_x - w / 2
-                y1 = HALF_HEIGHT - h / 2
-                x2 = screen_x + w / 2
-                y2 = HALF_HEIGHT + h / 2
+                x1 = screen_x - w * 0.5
+                y1 = half_height - h * 0.5
+                x2 = screen_x + w * 0.5
+                y2 = half_height + h * 0.5
 
                 downed = teammate.downed or teammate.health <= 0
                 body_color = "#4a8ad6" if not downed else "#5a5a5a"
-                name_color = "#bcd8ff" if not downed else "#c8c8c8"
-                label = teammate.name if not downed else f"{teammate.name} [DOWN]"
+                if h < SPRITE_LOD_DOT_H:
+                    create_rectangle(screen_x - 1, y1, screen_x + 1, y2, fill=body_color, outline="")
+                    continue
 
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=body_color, outline="#0f1118", width=2)
+                create_rectangle(x1, y1, x2, y2, fill=body_color, outline="#0f1118", width=2)
+                if h < SPRITE_LOD_BODY_H:
+                    continue
                 head_h = h * 0.28
                 head_color = "#f1c7ac" if not downed else "#b3b3b3"
-                self.canvas.create_oval(x1 + w * 0.2, y1 - head_h * 0.6, x2 - w * 0.2, y1 + head_h * 0.7, fill=head_color, outline="")
-                self.canvas.create_text(screen_x, y1 - 14, text=label, fill=name_color, font=("Consolas", 10, "bold"))
+                create_oval(x1 + w * 0.2, y1 - head_h * 0.6, x2 - w * 0.2, y1 + head_h * 0.7, fill=head_color, outline="")
+                if dist <= SPRITE_LABEL_MAX_DIST:
+                    name_color = "#bcd8ff" if not downed else "#c8c8c8"
+                    label = teammate.name if not downed else f"{teammate.name} [DOWN]"
+                    create_text(screen_x, y1 - 14, text=label, fill=name_color, font=self._font(10))
                 hp_ratio = 0.0 if downed else clamp(teammate.health / 100.0, 0.0, 1.0)
                 bar_w = max(24, int(w * 1.0))
-                bar_x1 = screen_x - bar_w / 2
-                bar_x2 = screen_x + bar_w / 2
+                bar_x1 = screen_x - bar_w * 0.5
+                bar_x2 = screen_x + bar_w * 0.5
                 bar_y1 = y1 - 6
-                self.canvas.create_rectangle(bar_x1, bar_y1, bar_x2, bar_y1 + 6, fill="#1a2029", outline="")
-                self.canvas.create_rectangle(bar_x1, bar_y1, bar_x1 + bar_w * hp_ratio, bar_y1 + 6, fill="#61d08a", outline="")
+                create_rectangle(bar_x1, bar_y1, bar_x2, bar_y1 + 6, fill="#1a2029", outline="")
+                create_rectangle(bar_x1, bar_y1, bar_x1 + bar_w * hp_ratio, bar_y1 + 6, fill="#61d08a", outline="")
             elif kind == "money":
-                h = int((HEIGHT * 0.22) / max(0.2, dist))
+                h = int(money_h_coef / (0.2 if dist < 0.2 else dist))
                 w = h
-                x1 = screen_x - w / 2
-                y1 = HALF_HEIGHT + h * 0.2
-                x2 = screen_x + w / 2
+                x1 = screen_x - w * 0.5
+                y1 = half_height + h * 0.2
+                x2 = screen_x + w * 0.5
                 y2 = y1 + h
-                self.canvas.create_oval(x1, y1, x2, y2, fill="#68d96f", outline="#19361b", width=2)
-                self.canvas.create_text(screen_x, y1 + h * 0.5, text="$", fill="#e9ffe5", font=("Consolas", 10, "bold"))
+                create_oval(x1, y1, x2, y2, fill="#68d96f", outline="#19361b", width=2)
+                create_text(screen_x, y1 + h * 0.5, text="$", fill="#e9ffe5", font=self._font(10))
             elif kind == "ping":
-                size = int((HEIGHT * 0.16) / max(0.2, dist))
-                self.canvas.create_oval(
+                size = int(ping_size_coef / (0.2 if dist < 0.2 else dist))
+                create_oval(
                     screen_x - size,
-                    HALF_HEIGHT - size,
+                    half_height - size,
                     screen_x + size,
-                    HALF_HEIGHT + size,
+                    half_height + size,
                     outline="#ffd967",
                     width=3,
                 )
-                self.canvas.create_text(screen_x, HALF_HEIGHT - size - 14, text="PING", fill="#ffea95", font=("Consolas", 10, "bold"))
-                owner = str(obj.get("owner", "TEAM")).upper()
-                self.canvas.create_text(screen_x, HALF_HEIGHT + size + 12, text=owner, fill="#ffe7ad", font=("Consolas", 9, "bold"))
+                create_text(screen_x, half_height - size - 14, text="PING", fill="#ffea95", font=self._font(10))
+                owner = str(obj if obj else "TEAM").upper()
+                create_text(screen_x, half_height + size + 12, text=owner, fill="#ffe7ad", font=self._font(9))
             elif kind == "objective":
-                size = int((HEIGHT * 0.2) / max(0.2, dist))
-                self.canvas.create_rectangle(
+                size = int(zone_size_coef / (0.2 if dist < 0.2 else dist))
+                create_rectangle(
                     screen_x - size,
-                    HALF_HEIGHT - size,
+                    half_height - size,
                     screen_x + size,
-                    HALF_HEIGHT + size,
+                    half_height + size,
                     outline="#7ce6ff",
                     width=3,
                 )
-                self.canvas.create_text(screen_x, HALF_HEIGHT - size - 14, text="ZONE", fill="#b9f1ff", font=("Consolas", 10, "bold"))
-                self.canvas.create_text(screen_x, HALF_HEIGHT + size + 12, text="DEFEND", fill="#b9f1ff", font=("Consolas", 9, "bold"))
+                create_text(screen_x, half_height - size - 14, text="ZONE", fill="#b9f1ff", font=self._font(10))
+                create_text(screen_x, half_height + size + 12, text="DEFEND", fill="#b9f1ff", font=self._font(9))
+
+    def _build_viewmodel(self, weapon: str) -> None:
+        """(Re)create the weapon silhouette as a persistent item group.
+
+        Geometry is laid out relative to (0, 0); render_viewmodel slides
+        the whole "viewmodel" tag with one canvas.move per frame instead
+        of recreating the primitives at the bobbed position.
+        """
+        canvas = self.canvas
+        canvas.delete("viewmodel")
+        canvas.create_rectangle(120, 92, 258, 172, fill="#313949", outline="", tags="viewmodel")
+        canvas.create_oval(136, 82, 258, 184, fill="#ddb195", outline="", tags="viewmodel")
+
+        if weapon == "pistol":
+            canvas.create_rectangle(40, 56, 210, 96, fill="#2f353d", outline="", tags="viewmodel")
+            canvas.create_rectangle(182, 63, 276, 83, fill="#4a525d", outline="", tags="viewmodel")
+            canvas.create_polygon(95, 95, 155, 95, 145, 164, 92, 164, fill="#2a3038", outline="", tags="viewmodel")
+        elif weapon == "shotgun":
+            canvas.create_rectangle(20, 68, 285, 96, fill="#53422e", outline="", tags="viewmodel")
+            canvas.create_rectangle(130, 56, 316, 78, fill="#767d85", outline="", tags="viewmodel")
+            canvas.create_rectangle(96, 96, 150, 124, fill="#343a42", outline="", tags="viewmodel")
+        elif weapon == "rifle":
+            canvas.create_rectangle(24, 70, 290, 104, fill="#2d3f2f", outline="", tags="viewmodel")
+            canvas.create_rectangle(170, 62, 326, 82, fill="#4f5a63", outline="", tags="viewmodel")
+            canvas.create_rectangle(106, 102, 146, 154, fill="#1f2429", outline="", tags="viewmodel")
+            canvas.create_rectangle(76, 60, 124, 70, fill="#606870", outline="", tags="viewmodel")
+        else:
+            canvas.create_rectangle(16, 66, 302, 108, fill="#4a535f", outline="", tags="viewmodel")
+            canvas.create_oval(272, 64, 350, 112, fill="#5f6975", outline="", tags="viewmodel")
+            canvas.create_polygon(338, 71, 382, 87, 338, 103, fill="#c9b05d", outline="", tags="viewmodel")
+            canvas.create_rectangle(78, 108, 114, 156, fill="#2e343b", outline="", tags="viewmodel")
+
+        self._viewmodel_weapon = weapon
+        self._viewmodel_x = 0.0
+        self._viewmodel_y = 0.0
 
     def render_viewmodel(self, now: float) -> None:
+        canvas = self.canvas
         if self.game_state not in {"playing", "glitch"}:
+            if not self._viewmodel_hidden:
+                self._viewmodel_hidden = True
+                canvas.itemconfigure("viewmodel", state="hidden")
             return
 
-        moving = any(key in self.keys for key in ("w", "a", "s", "d"))
+        moving = bool(self.local_keymask & KEYBIT_MOVE)
         bob = math.sin(now * 8.0) * (6.0 if moving else 2.2)
         sway = math.cos(now * 6.4) * (4.0 if moving else 1.4)
         kick = self.weapon_kick * 16.0
@@ -2655,66 +3507,26 @@ class FPSBotArena:
         base_x = WIDTH - 320 + sway
         base_y = HEIGHT - 170 + bob + kick * 0.55
 
-        hand_x1 = base_x + 120
-        hand_y1 = base_y + 92
-        hand_x2 = base_x + 258
-        hand_y2 = base_y + 172
-        self.canvas.create_rectangle(hand_x1, hand_y1, hand_x2, hand_y2, fill="#313949", outline="")
-        self.canvas.create_oval(hand_x1 + 16, hand_y1 - 10, hand_x2, hand_y2 + 12, fill="#ddb195", outline="")
-
         weapon = self.current_weapon
-        muzzle_x = base_x + 280
-        muzzle_y = base_y + 66
-
-        if weapon == "pistol":
-            self.canvas.create_rectangle(base_x + 40, base_y + 56, base_x + 210, base_y + 96, fill="#2f353d", outline="")
-            self.canvas.create_rectangle(base_x + 182, base_y + 63, base_x + 276, base_y + 83, fill="#4a525d", outline="")
-            self.canvas.create_polygon(
-                base_x + 95,
-                base_y + 95,
-                base_x + 155,
-                base_y + 95,
-                base_x + 145,
-                base_y + 164,
-                base_x + 92,
-                base_y + 164,
-                fill="#2a3038",
-                outline="",
-            )
-            muzzle_x = base_x + 280
-            muzzle_y = base_y + 73
-        elif weapon == "shotgun":
-            self.canvas.create_rectangle(base_x + 20, base_y + 68, base_x + 285, base_y + 96, fill="#53422e", outline="")
-            self.canvas.create_rectangle(base_x + 130, base_y + 56, base_x + 316, base_y + 78, fill="#767d85", outline="")
-            self.canvas.create_rectangle(base_x + 96, base_y + 96, base_x + 150, base_y + 124, fill="#343a42", outline="")
-            muzzle_x = base_x + 318
-            muzzle_y = base_y + 68
-        elif weapon == "rifle":
-            self.canvas.create_rectangle(base_x + 24, base_y + 70, base_x + 290, base_y + 104, fill="#2d3f2f", outline="")
-            self.canvas.create_rectangle(base_x + 170, base_y + 62, base_x + 326, base_y + 82, fill="#4f5a63", outline="")
-            self.canvas.create_rectangle(base_x + 106, base_y + 102, base_x + 146, base_y + 154, fill="#1f2429", outline="")
-            self.canvas.create_rectangle(base_x + 76, base_y + 60, base_x + 124, base_y + 70, fill="#606870", outline="")
-            muzzle_x = base_x + 328
-            muzzle_y = base_y + 72
-        else:
-            self.canvas.create_rectangle(base_x + 16, base_y + 66, base_x + 302, base_y + 108, fill="#4a535f", outline="")
-            self.canvas.create_oval(base_x + 272, base_y + 64, base_x + 350, base_y + 112, fill="#5f6975", outline="")
-            self.canvas.create_polygon(
-                base_x + 338,
-                base_y + 71,
-                base_x + 382,
-                base_y + 87,
-                base_x + 338,
-                base_y + 103,
-                fill="#c9b05d",
-                outline="",
-            )
-            self.canvas.create_rectangle(base_x + 78, base_y + 108, base_x + 114, base_y + 156, fill="#2e343b", outline="")
-            muzzle_x = base_x + 378
-            muzzle_y = base_y + 87
+        if weapon != self._viewmodel_weapon:
+            self._build_viewmodel(weapon)
+        if self._viewmodel_hidden:
+            self._viewmodel_hidden = False
+            canvas.itemconfigure("viewmodel", state="normal")
+
+        dx = base_x - self._viewmodel_x
+        dy = base_y - self._viewmodel_y
+        if dx or dy:
+            canvas.move("viewmodel", dx, dy)
+            self._viewmodel_x = base_x
+            self._viewmodel_y = base_y
+        # Above this frame's scene sprites; render_hud re-raises "hud"
+        # right after, keeping the HUD on top of the weapon.
+        canvas.tag_raise("viewmodel")
 
         if self.muzzle_flash_timer > 0:
-            self.render_muzzle_flash(muzzle_x, muzzle_y, weapon)
+            muzzle_dx, muzzle_dy = _VIEWMODEL_MUZZLE[weapon]
+            self.render_muzzle_flash(base_x + muzzle_dx, base_y + muzzle_dy, weapon)
 
     def render_muzzle_flash(self, x: float, y: float, weapon: str) -> None:
         size = 24.0 + self.muzzle_flash_timer * 42.0
@@ -2726,148 +3538,218 @@ class FPSBotArena:
         self.canvas.create_oval(x - size, y - size, x + size, y + size, fill="#ffd56b", outline="")
         self.canvas.create_oval(x - size * 0.62, y - size * 0.62, x + size * 0.62, y + size * 0.62, fill="#fff0b6", outline="")
 
-        rays = 8
-        for i in range(rays):
-            ang = (math.tau / rays) * i + random.uniform(-0.18, 0.18)
-            length = size * random.uniform(1.15, 1.65)
-            rx = x + math.cos(ang) * length
-            ry = y + math.sin(ang) * length
-            self.canvas.create_line(x, y, rx, ry, fill="#fff7d0", width=3)
+        for ux, uy in random.choice(_FLASH_RAY_PHASES):
+            self.canvas.create_line(x, y, x + ux * size, y + uy * size, fill="#fff7d0", width=3)
+
+    def _build_hud_chrome(self) -> None:
+        """(Re)create the fixed HUD chrome once per resolution.
+
+        Crosshair, panel frames, bar backgrounds and constant labels never
+        change between frames. They carry the "hud" tag, survive the frame
+        wipe in render(), and render_hud raises them above the scene before
+        drawing the per-frame values on top.
+        """
+        canvas = self.canvas
+        canvas.delete("hud")
 
-    def render_hud(self) -> None:
         cx = WIDTH // 2
         cy = HALF_HEIGHT
-        self.canvas.create_oval(cx - 11, cy - 11, cx + 11, cy + 11, outline="#d8e6f7", width=2)
-        self.canvas.create_line(cx - 16, cy, cx - 6, cy, fill="#f3f8ff", width=2)
-        self.canvas.create_line(cx + 6, cy, cx + 16, cy, fill="#f3f8ff", width=2)
-        self.canvas.create_line(cx, cy - 16, cx, cy - 6, fill="#f3f8ff", width=2)
-        self.canvas.create_line(cx, cy + 6, cx, cy + 16, fill="#f3f8ff", width=2)
-        self.canvas.create_oval(cx - 2, cy - 2, cx + 2, cy + 2, fill="#ffffff", outline="")
+        canvas.create_oval(cx - 11, cy - 11, cx + 11, cy + 11, outline="#d8e6f7", width=2, tags="hud")
+        canvas.create_line(cx - 16, cy, cx - 6, cy, fill="#f3f8ff", width=2, tags="hud")
+        canvas.create_line(cx + 6, cy, cx + 16, cy, fill="#f3f8ff", width=2, tags="hud")
+        canvas.create_line(cx, cy - 16, cx, cy - 6, fill="#f3f8ff", width=2, tags="hud")
+        canvas.create_line(cx, cy + 6, cx, cy + 16, fill="#f3f8ff", width=2, tags="hud")
+        canvas.create_oval(cx - 2, cy - 2, cx + 2, cy + 2, fill="#ffffff", outline="", tags="hud")
 
         left_x1 = 18
         left_x2 = 364
         top_y1 = 16
         top_y2 = 188
-        self.draw_ui_panel(left_x1, top_y1, left_x2, top_y2)
-        self.canvas.create_text(left_x1 + 14, top_y1 + 10, anchor="nw", text="COMBAT STATUS", fill="#d9e9ff", font=("Consolas", 12, "bold"))
+        self.draw_ui_panel(left_x1, top_y1, left_x2, top_y2, tags="hud")
+        canvas.create_text(left_x1 + 14, top_y1 + 10, anchor="nw", text="COMBAT STATUS", fill="#d9e9ff", font=self._font(12), tags="hud")
 
-        hp_cap = max(1.0, self.get_max_health_cap())
-        hp_ratio = clamp(self.player_health / hp_cap, 0.0, 1.0)
         hp_bar_x1 = left_x1 + 14
         hp_bar_x2 = left_x2 - 14
         hp_bar_y1 = top_y1 + 42
-        self.canvas.create_rectangle(hp_bar_x1, hp_bar_y1, hp_bar_x2, hp_bar_y1 + 22, fill="#1b222d", outline="")
-        hp_fill_color = "#52cc8f" if self.player_health > 35 else "#d76659"
-        self.canvas.create_rectangle(hp_bar_x1, hp_bar_y1, hp_bar_x1 + (hp_bar_x2 - hp_bar_x1) * hp_ratio, hp_bar_y1 + 22, fill=hp_fill_color, outline="")
-        self.canvas.create_text(hp_bar_x1 + 8, hp_bar_y1 + 11, anchor="w", text=f"HP {int(self.player_health)}/{int(hp_cap)}", fill="#ffffff", font=("Consolas", 11, "bold"))
-
-        weapon_name = WEAPON_DATA[self.current_weapon]["name"]
-        ammo_cfg = WEAPON_DATA[self.current_weapon]
-        if ammo_cfg["infinite"]:
-            ammo_text = "INF"
-            ammo_ratio = 1.0
-        else:
-            ammo_text = f"{self.clip[self.current_weapon]}/{self.ammo[self.current_weapon]}"
-            mag = max(1, int(ammo_cfg["mag_size"]))
-            ammo_ratio = clamp(self.clip[self.current_weapon] / mag, 0.0, 1.0)
-
+        canvas.create_rectangle(hp_bar_x1, hp_bar_y1, hp_bar_x2, hp_bar_y1 + 22, fill="#1b222d", outline="", tags="hud")
         ammo_bar_y1 = hp_bar_y1 + 34
-        self.canvas.create_rectangle(hp_bar_x1, ammo_bar_y1, hp_bar_x2, ammo_bar_y1 + 18, fill="#1b222d", outline="")
-        self.canvas.create_rectangle(
-            hp_bar_x1,
-            ammo_bar_y1,
-            hp_bar_x1 + (hp_bar_x2 - hp_bar_x1) * ammo_ratio,
-            ammo_bar_y1 + 18,
-            fill="#8ac6ff" if ammo_ratio > 0.2 else "#d98753",
-            outline="",
-        )
-        self.canvas.create_text(hp_bar_x1 + 8, ammo_bar_y1 + 9, anchor="w", text=f"{weapon_name}  {ammo_text}", fill="#edf5ff", font=("Consolas", 10, "bold"))
-
-        status_line = "READY"
-        status_color = "#7fd89d"
-        if self.player_downed:
-            status_line = f"DOWNED  BLEED OUT {self.player_bleed_out:.1f}s"
-            status_color = "#ff9f9f"
-        elif self.current_reload_weapon is not None:
-            status_line = "RELOADING..."
-            status_color = "#ffd47e"
-        elif not ammo_cfg["infinite"]:
-            low = self.clip[self.current_weapon] <= max(2, int(ammo_cfg["mag_size"] * 0.2))
-            if low:
-                status_line = "LOW AMMO"
-                status_color = "#ff9a7f"
-
-        self.canvas.create_text(hp_bar_x1, ammo_bar_y1 + 30, anchor="nw", text=status_line, fill=status_color, font=("Consolas", 10, "bold"))
-        self.canvas.create_text(
-            hp_bar_x1,
-            ammo_bar_y1 + 50,
-            anchor="nw",
-            text=f"K {self.player_kills}   D {self.player_deaths}   HS {self.player_headshots}",
-            fill="#d2e6ff",
-            font=("Consolas", 10, "bold"),
-        )
+        canvas.create_rectangle(hp_bar_x1, ammo_bar_y1, hp_bar_x2, ammo_bar_y1 + 18, fill="#1b222d", outline="", tags="hud")
 
         info_y1 = top_y2 + 10
         info_y2 = info_y1 + 124
-        self.draw_ui_panel(left_x1, info_y1, left_x2, info_y2)
-        self.canvas.create_text(left_x1 + 14, info_y1 + 10, anchor="nw", text=f"Money  ${self.player_money}", fill="#8ce39e", font=("Consolas", 14, "bold"))
-        self.canvas.create_text(left_x1 + 14, info_y1 + 38, anchor="nw", text=f"Wave {self.wave}   Bots {self.alive_bots()}", fill="#e7eef9", font=("Consolas", 12, "bold"))
-        self.canvas.create_text(
-            left_x1 + 14,
-            info_y1 + 64,
-            anchor="nw",
-            text=f"Level {self.profile_level}   XP {self.profile_xp}/{self.xp_to_next_level()}   Perks {self.perk_points}",
-            fill="#cbe0ff",
-            font=("Consolas", 10, "bold"),
-        )
-        xp_ratio = clamp(self.profile_xp / max(1, self.xp_to_next_level()), 0.0, 1.0)
+        self.draw_ui_panel(left_x1, info_y1, left_x2, info_y2, tags="hud")
         xp_x1 = left_x1 + 14
         xp_x2 = left_x2 - 14
         xp_y = info_y2 - 24
-        self.canvas.create_rectangle(xp_x1, xp_y, xp_x2, xp_y + 10, fill="#1b2230", outline="")
-        self.canvas.create_rectangle(xp_x1, xp_y, xp_x1 + (xp_x2 - xp_x1) * xp_ratio, xp_y + 10, fill="#88b9ff", outline="")
+        canvas.create_rectangle(xp_x1, xp_y, xp_x2, xp_y + 10, fill="#1b2230", outline="", tags="hud")
 
         right_x2 = WIDTH - 18
         right_x1 = max(left_x2 + 12, WIDTH - 430)
         right_y1 = 16
         right_y2 = 210
-        self.draw_ui_panel(right_x1, right_y1, right_x2, right_y2)
-
-        objective_text = "Eliminate all bots"
-        if self.objective_type == "defend_zone":
-            objective_text = f"Hold zone {self.objective_timer:.1f}s"
-        self.canvas.create_text(right_x1 + 14, right_y1 + 10, anchor="nw", text="OBJECTIVE", fill="#cbe7ff", font=("Consolas", 12, "bold"))
-        self.canvas.create_text(right_x1 + 14, right_y1 + 36, anchor="nw", text=objective_text, fill="#ecf5ff", font=("Consolas", 13, "bold"))
-        if self.wave_timer > 0:
-            self.canvas.create_text(right_x1 + 14, right_y1 + 62, anchor="nw", text=f"Next wave in {self.wave_timer:.1f}s", fill="#ffe8a1", font=("Consolas", 11, "bold"))
-
-        teammate_count = len(self.remote_players) if self.net_mode == "host" else len(self.remote_render_players)
-        if self.net_mode != "single":
-            self.canvas.create_text(right_x1 + 14, right_y1 + 92, anchor="nw", text=f"Teammates {teammate_count}", fill="#9ecbff", font=("Consolas", 12, "bold"))
-            self.canvas.create_text(right_x1 + 14, right_y1 + 114, anchor="nw", text=self.net_status, fill="#d4e5ff", font=("Consolas", 10))
-
-        self.canvas.create_text(
-            right_x1 + 14,
-            right_y2 - 26,
-            anchor="nw",
-            text=f"Quality {RAY_COUNT} rays ({'Auto' if self.adaptive_quality_enabled else 'Manual'})",
-            fill="#c1cfde",
-            font=("Consolas", 10),
-        )
-
-        help_text = "WASD + Mouse | B Shop | Q Ping | R Reload | TAB Scoreboard | F1-4 Perks"
-        if self.net_mode == "client":
-            help_text = "CO-OP Client | WASD+Mouse -> Host | Q Ping | R Reload | TAB Scoreboard | Esc Settings"
-        elif self.net_mode == "host":
-            money_mode = "Shared $" if self.shared_money else "Split $"
-            help_text = f"CO-OP Host | {money_mode} | TAB Scoreboard | Esc Settings"
+        self.draw_ui_panel(right_x1, right_y1, right_x2, right_y2, tags="hud")
+        canvas.create_text(right_x1 + 14, right_y1 + 10, anchor="nw", text="OBJECTIVE", fill="#cbe7ff", font=self._font(12), tags="hud")
 
         help_x1 = max(16, WIDTH // 2 - 360)
         help_x2 = min(WIDTH - 16, WIDTH // 2 + 360)
         help_y1 = HEIGHT - 40
         help_y2 = HEIGHT - 10
-        self.draw_ui_panel(help_x1, help_y1, help_x2, help_y2, fill="#121926", outline="#4f6788")
-        self.canvas.create_text((help_x1 + help_x2) / 2, help_y1 + 15, text=help_text, fill="#e4eefb", font=("Consolas", 10, "bold"))
+        self.draw_ui_panel(help_x1, help_y1, help_x2, help_y2, fill="#121926", outline="#4f6788", tags="hud")
+
+        # Dynamic HUD values as persistent items too: render_hud rewrites
+        # them through itemconfigure/coords and skips the Tcl call entirely
+        # whenever the displayed value is unchanged from last frame.
+        ids: dict[str, int] = {}
+        self._hud_ids = ids
+        self._hud_cache: dict[str, object] = {}
+        self._hud_bar_geom = {
+            "hp_fill": (hp_bar_x1, hp_bar_y1, hp_bar_x2, hp_bar_y1 + 22),
+            "ammo_fill": (hp_bar_x1, ammo_bar_y1, hp_bar_x2, ammo_bar_y1 + 18),
+            "xp_fill": (xp_x1, xp_y, xp_x2, xp_y + 10),
+        }
+        ids["hp_fill"] = canvas.create_rectangle(hp_bar_x1, hp_bar_y1, hp_bar_x1, hp_bar_y1 + 22, fill="#52cc8f", outline="", tags="hud")
+        ids["hp_text"] = canvas.create_text(hp_bar_x1 + 8, hp_bar_y1 + 11, anchor="w", text="", fill="#ffffff", font=self._font(11), tags="hud")
+        ids["ammo_fill"] = canvas.create_rectangle(hp_bar_x1, ammo_bar_y1, hp_bar_x1, ammo_bar_y1 + 18, fill="#8ac6ff", outline="", tags="hud")
+        ids["ammo_text"] = canvas.create_text(hp_bar_x1 + 8, ammo_bar_y1 + 9, anchor="w", text="", fill="#edf5ff", font=self._font(10), tags="hud")
+        ids["status"] = canvas.create_text(hp_bar_x1, ammo_bar_y1 + 30, anchor="nw", text="", fill="#7fd89d", font=self._font(10), tags="hud")
+        ids["kd"] = canvas.create_text(hp_bar_x1, ammo_bar_y1 + 50, anchor="nw", text="", fill="#d2e6ff", font=self._font(10), tags="hud")
+        ids["money"] = canvas.create_text(left_x1 + 14, info_y1 + 10, anchor="nw", text="", fill="#8ce39e", font=self._font(14), tags="hud")
+        ids["wave"] = canvas.create_text(left_x1 + 14, info_y1 + 38, anchor="nw", text="", fill="#e7eef9", font=self._font(12), tags="hud")
+        ids["level"] = canvas.create_text(left_x1 + 14, info_y1 + 64, anchor="nw", text="", fill="#cbe0ff", font=self._font(10), tags="hud")
+        ids["xp_fill"] = canvas.create_rectangle(xp_x1, xp_y, xp_x1, xp_y + 10, fill="#88b9ff", outline="", tags="hud")
+        ids["objective"] = canvas.create_text(right_x1 + 14, right_y1 + 36, anchor="nw", text="", fill="#ecf5ff", font=self._font(13), tags="hud")
+        ids["wave_timer"] = canvas.create_text(right_x1 + 14, right_y1 + 62, anchor="nw", text="", fill="#ffe8a1", font=self._font(11), state="hidden", tags="hud")
+        if self.net_mode != "single":
+            ids["teammates"] = canvas.create_text(right_x1 + 14, right_y1 + 92, anchor="nw", text="", fill="#9ecbff", font=self._font(12), tags="hud")
+            ids["net_status"] = canvas.create_text(right_x1 + 14, right_y1 + 114, anchor="nw", text="", fill="#d4e5ff", font=self._font(10, bold=False), tags="hud")
+        ids["quality"] = canvas.create_text(right_x1 + 14, right_y2 - 26, anchor="nw", text="", fill="#c1cfde", font=self._font(10, bold=False), tags="hud")
+        ids["help"] = canvas.create_text((help_x1 + help_x2) / 2, help_y1 + 15, text="", fill="#e4eefb", font=self._font(10), tags="hud")
+
+    def _hud_set_text(self, key: str, text: str, fill: str | None = None) -> None:
+        cached = self._hud_cache.get(key)
+        if cached == (text, fill):
+            return
+        self._hud_cache[key] = (text, fill)
+        if fill is None or (cached is not None and cached[1] == fill):
+            self.canvas.itemconfigure(self._hud_ids[key], text=text)
+        else:
+            self.canvas.itemconfigure(self._hud_ids[key], text=text, fill=fill)
+
+    def _hud_set_bar(self, key: str, ratio: float, fill: str | None = None) -> None:
+        cached = self._hud_cache.get(key)
+        if cached == (ratio, fill):
+            return
+        item = self._hud_ids[key]
+        x1, y1, x2_full, y2 = self._hud_bar_geom[key]
+        if cached is None or cached[0] != ratio:
+            self.canvas.coords(item, x1, y1, x1 + (x2_full - x1) * ratio, y2)
+        if fill is not None and (cached is None or cached[1] != fill):
+            self.canvas.itemconfigure(item, fill=fill)
+        self._hud_cache[key] = (ratio, fill)
+
+    def _hud_value_changed(self, key: str, value) -> bool:
+        """True when `value` differs from the last one recorded for `key`.
+
+        Guards the format-string construction itself: when the numbers
+        behind a HUD line are unchanged there is no point rebuilding the
+        text just for _hud_set_text to discard it.
+        """
+        val_key = key + ":val"
+        if self._hud_cache.get(val_key) == value:
+            return False
+        self._hud_cache[val_key] = value
+        return True
+
+    def _hud_set_visible(self, key: str, visible: bool) -> None:
+        vis_key = key + ":vis"
+        if self._hud_cache.get(vis_key) != visible:
+            self._hud_cache[vis_key] = visible
+            self.canvas.itemconfigure(self._hud_ids[key], state="normal" if visible else "hidden")
+
+    def render_hud(self) -> None:
+        # Lift the persistent chrome above this frame's scene items; the
+        # remaining per-frame items below are created afterwards and stack
+        # on top of it.
+        self.canvas.tag_raise("hud")
+
+        hp_cap = max(1.0, self.get_max_health_cap())
+        hp_ratio = clamp(self.player_health / hp_cap, 0.0, 1.0)
+        self._hud_set_bar("hp_fill", hp_ratio, "#52cc8f" if self.player_health > 35 else "#d76659")
+        hp_int = int(self.player_health)
+        cap_int = int(hp_cap)
+        if self._hud_value_changed("hp_text", (hp_int, cap_int)):
+            self._hud_set_text("hp_text", f"HP {hp_int}/{cap_int}")
+
+        weapon = self.current_weapon
+        weapon_id = WEAPON_ID[weapon]
+        clip_left = self.clip[weapon]
+        if WEAPON_INFINITE[weapon_id]:
+            ammo_ratio = 1.0
+        else:
+            ammo_ratio = clamp(clip_left / max(1, WEAPON_MAG_SIZE[weapon_id]), 0.0, 1.0)
+        self._hud_set_bar("ammo_fill", ammo_ratio, "#8ac6ff" if ammo_ratio > 0.2 else "#d98753")
+        if self._hud_value_changed("ammo_text", (weapon_id, clip_left, self.ammo[weapon])):
+            ammo_text = "INF" if WEAPON_INFINITE[weapon_id] else f"{clip_left}/{self.ammo[weapon]}"
+            self._hud_set_text("ammo_text", f"{WEAPON_NAME[weapon_id]}  {ammo_text}")
+
+        # Displayed tenths, not the raw float: the string only changes when
+        # the first decimal does, so key the rebuild on that.
+        bleed_tenths = round(self.player_bleed_out * 10)
+        low_ammo = not WEAPON_INFINITE[weapon_id] and clip_left <= max(2, int(WEAPON_MAG_SIZE[weapon_id] * 0.2))
+        if self._hud_value_changed("status", (self.player_downed, bleed_tenths, self.current_reload_weapon, low_ammo)):
+            status_line = "READY"
+            status_color = "#7fd89d"
+            if self.player_downed:
+                status_line = f"DOWNED  BLEED OUT {bleed_tenths / 10:.1f}s"
+                status_color = "#ff9f9f"
+            elif self.current_reload_weapon is not None:
+                status_line = "RELOADING..."
+                status_color = "#ffd47e"
+            elif low_ammo:
+                status_line = "LOW AMMO"
+                status_color = "#ff9a7f"
+            self._hud_set_text("status", status_line, status_color)
+
+        if self._hud_value_changed("kd", (self.player_kills, self.player_deaths, self.player_headshots)):
+            self._hud_set_text("kd", f"K {self.player_kills}   D {self.player_deaths}   HS {self.player_headshots}")
+        if self._hud_value_changed("money", self.player_money):
+            self._hud_set_text("money", f"Money  ${self.player_money}")
+        alive = self.alive_bots()
+        if self._hud_value_changed("wave", (self.wave, alive)):
+            self._hud_set_text("wave", f"Wave {self.wave}   Bots {alive}")
+        xp_needed = self.xp_to_next_level()
+        if self._hud_value_changed("level", (self.profile_level, self.profile_xp, xp_needed, self.perk_points)):
+            self._hud_set_text("level", f"Level {self.profile_level}   XP {self.profile_xp}/{xp_needed}   Perks {self.perk_points}")
+        self._hud_set_bar("xp_fill", clamp(self.profile_xp / max(1, xp_needed), 0.0, 1.0))
+
+        zone_tenths = round(self.objective_timer * 10) if self.objective_type == "defend_zone" else -1
+        if self._hud_value_changed("objective", zone_tenths):
+            objective_text = "Eliminate all bots" if zone_tenths < 0 else f"Hold zone {zone_tenths / 10:.1f}s"
+            self._hud_set_text("objective", objective_text)
+        wave_pending = self.wave_timer > 0
+        self._hud_set_visible("wave_timer", wave_pending)
+        if wave_pending:
+            wave_tenths = round(self.wave_timer * 10)
+            if self._hud_value_changed("wave_timer", wave_tenths):
+                self._hud_set_text("wave_timer", f"Next wave in {wave_tenths / 10:.1f}s")
+
+        if self.net_mode != "single":
+            teammate_count = len(self.remote_players) if self.net_mode == "host" else len(self.remote_render_players)
+            if self._hud_value_changed("teammates", teammate_count):
+                self._hud_set_text("teammates", f"Teammates {teammate_count}")
+            self._hud_set_text("net_status", self.net_status)
+
+        if self._hud_value_changed("quality", (RAY_COUNT, self.adaptive_quality_enabled)):
+            self._hud_set_text("quality", f"Quality {RAY_COUNT} rays ({'Auto' if self.adaptive_quality_enabled else 'Manual'})")
+
+        if self._hud_value_changed("help", self.shared_money):
+            help_text = "WASD + Mouse | B Shop | Q Ping | R Reload | TAB Scoreboard | F1-4 Perks"
+            if self.net_mode == "client":
+                help_text = "CO-OP Client | WASD+Mouse -> Host | Q Ping | R Reload | TAB Scoreboard | Esc Settings"
+            elif self.net_mode == "host":
+                money_mode = "Shared $" if self.shared_money else "Split $"
+                help_text = f"CO-OP Host | {money_mode} | TAB Scoreboard | Esc Settings"
+            self._hud_set_text("help", help_text)
 
         if self.damage_direction_timer > 0.01:
             rel = normalize_angle(self.last_damage_from - self.player_angle)
@@ -2964,7 +3846,7 @@ class FPSBotArena:
         x2 = x1 + panel_w
         y2 = y1 + panel_h
 
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#05070d", outline="", stipple="gray50")
+        self._draw_overlay("scoreboard")
         self.canvas.create_rectangle(x1, y1, x2, y2, fill="#101722", outline="#88a7cf", width=2)
         self.canvas.create_text(
             x1 + 24,
@@ -2972,7 +3854,7 @@ class FPSBotArena:
             anchor="nw",
             text="SCOREBOARD",
             fill="#e5f0ff",
-            font=("Consolas", 20, "bold"),
+            font=self._font(20),
         )
         self.canvas.create_text(
             x2 - 24,
@@ -2980,7 +3862,7 @@ class FPSBotArena:
             anchor="ne",
             text="Hold TAB",
             fill="#b2c8e8",
-            font=("Consolas", 11),
+            font=self._font(11, bold=False),
         )
 
         cols = [
@@ -2994,7 +3876,7 @@ class FPSBotArena:
         header_y = y1 + 54
         self.canvas.create_line(x1 + 18, header_y + 16, x2 - 18, header_y + 16, fill="#496181", width=1)
         for label, x, anchor in cols:
-            self.canvas.create_text(x, header_y, anchor=anchor, text=label, fill="#a9c3e5", font=("Consolas", 11, "bold"))
+            self.canvas.create_text(x, header_y, anchor=anchor, text=label, fill="#a9c3e5", font=self._font(11))
 
         start_y = header_y + 32
         for idx, row in enumerate(rows):
@@ -3018,10 +3900,19 @@ class FPSBotArena:
                 color = "#eaf3ff" if is_local else "#d3deec"
                 if col_idx == 5 and hp == "DOWN":
                     color = "#ffadad"
-                self.canvas.create_text(x, row_y, anchor=anchor, text=value, fill=color, font=("Consolas", 11, "bold" if is_local else "normal"))
+                self.canvas.create_text(x, row_y, anchor=anchor, text=value, fill=color, font=self._font(11, bold=is_local))
 
     def render_pause_menu(self) -> None:
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#050810", outline="", stipple="gray50")
+        self._draw_overlay("pause")
+
+        # Rebuild the click hitbox table only when the layout it mirrors
+        # can have moved, instead of re-appending ~20 dataclasses every
+        # paused frame.
+        layout_key = (WIDTH, HEIGHT)
+        self._pause_hitboxes_stale = layout_key != self._pause_layout_key
+        if self._pause_hitboxes_stale:
+            self._pause_layout_key = layout_key
+            self.pause_hitboxes = []
 
         panel_w = min(900, WIDTH - 56)
         panel_h = min(550, HEIGHT - 56)
@@ -3038,7 +3929,7 @@ class FPSBotArena:
             anchor="nw",
             text="PAUSE SETTINGS",
             fill="#edf5ff",
-            font=("Consolas", 28, "bold"),
+            font=self._font(28),
         )
         self.canvas.create_text(
             x1 + 30,
@@ -3046,7 +3937,7 @@ class FPSBotArena:
             anchor="nw",
             text="Tune controls and visuals. Click arrows/toggles, press Esc to resume.",
             fill="#cad9ee",
-            font=("Consolas", 12),
+            font=self._font(12, bold=False),
         )
 
         row_y = y1 + 102
@@ -3157,7 +4048,7 @@ class FPSBotArena:
             text=f"Perks: F1 Vitality {self.perks['vitality']} | F2 Mobility {self.perks['mobility']} | "
             f"F3 Regen {self.perks['regen']} | F4 Weapon {self.perks['weapon']} | Points: {self.perk_points}",
             fill="#d7e8ff",
-            font=("Consolas", 10),
+            font=self._font(10, bold=False),
         )
 
         if self.fullscreen_enabled:
@@ -3167,7 +4058,7 @@ class FPSBotArena:
                 anchor="nw",
                 text="Resolution preset applies when fullscreen is Off.",
                 fill="#c9d8ea",
-                font=("Consolas", 11),
+                font=self._font(11, bold=False),
             )
 
         button_y1 = y2 - 78
@@ -3207,7 +4098,7 @@ class FPSBotArena:
         left_label: str = "-",
         right_label: str = "+",
     ) -> None:
-        self.canvas.create_text(panel_x1 + 30, y + 9, anchor="nw", text=label, fill="#edf4ff", font=("Consolas", 14, "bold"))
+        self.canvas.create_text(panel_x1 + 30, y + 9, anchor="nw", text=label, fill="#edf4ff", font=self._font(14))
 
         control_x = panel_x2 - 310
         left_x1 = control_x
@@ -3217,7 +4108,7 @@ class FPSBotArena:
 
         self.draw_pause_button(left_x1, y, left_x2, y + 40, left_label, left_action, "#2a3950")
         self.canvas.create_rectangle(control_x + 94, y, control_x + 200, y + 40, fill="#0e1622", outline="#617a9f", width=2)
-        self.canvas.create_text(control_x + 147, y + 20, text=value, fill="#f7fbff", font=("Consolas", 12, "bold"))
+        self.canvas.create_text(control_x + 147, y + 20, text=value, fill="#f7fbff", font=self._font(12))
         self.draw_pause_button(right_x1, y, right_x2, y + 40, right_label, right_action, "#2a3950")
 
     def draw_pause_button(
@@ -3232,10 +4123,29 @@ class FPSBotArena:
     ) -> None:
         self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline="#90add1", width=2)
         self.canvas.create_rectangle(x1, y1, x2, y2, fill="#0d111a", outline="", stipple="gray50")
-        self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=text, fill="#eef6ff", font=("Consolas", 11, "bold"))
-        self.pause_hitboxes.append(PauseHitbox(x1=x1, y1=y1, x2=x2, y2=y2, action=action))
+        self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=text, fill="#eef6ff", font=self._font(11))
+        if self._pause_hitboxes_stale:
+            self.pause_hitboxes.append(PauseHitbox(x1=x1, y1=y1, x2=x2, y2=y2, action=action))
 
     def draw_weapon_bar(self) -> None:
+        # The bar is a persistent "wbar" item group; the batched rebuild
+        # only runs when the state it displays actually changes, so the
+        # steady-state per-frame cost is one tag_raise.
+        state_key = (
+            WIDTH,
+            HEIGHT,
+            self.current_weapon,
+            tuple(self.owned_weapons[weapon] for weapon in WEAPON_ORDER),
+            tuple(self.clip[weapon] for weapon in WEAPON_ORDER),
+            tuple(self.ammo[weapon] for weapon in WEAPON_ORDER),
+        )
+        if state_key != self._wbar_key:
+            self._wbar_key = state_key
+            self._build_weapon_bar()
+        self.canvas.tag_raise("wbar")
+
+    def _build_weapon_bar(self) -> None:
+        self.canvas.delete("wbar")
         slot_count = len(WEAPON_ORDER)
         margin_x = 22
         gap = 10
@@ -3244,56 +4154,55 @@ class FPSBotArena:
         slot_h = 54
         y = HEIGHT - 106
         x = margin_x
+        title_font = self._font(11)
+        line_font = self._font(10, bold=False)
+        cmds: list[str] = []
+        append = cmds.append
         for idx, weapon in enumerate(WEAPON_ORDER):
             owned = self.owned_weapons[weapon]
             current = weapon == self.current_weapon
             base_color = "#1f2e40" if owned else "#14181f"
             border = "#f5d57a" if current else "#4f5f76"
-            self.canvas.create_rectangle(x, y, x + slot_w, y + slot_h, fill=base_color, outline=border, width=2)
-            self.canvas.create_rectangle(x, y, x + slot_w, y + slot_h, fill="#0a0f18", outline="", stipple="gray50")
+            append(f"create rectangle {x} {y} {x + slot_w} {y + slot_h} -fill {base_color} -outline {border} -width 2 -tags wbar")
+            append(f"create rectangle {x} {y} {x + slot_w} {y + slot_h} -fill #0a0f18 -outline {{}} -stipple gray50 -tags wbar")
 
             if owned:
                 line2 = "Equipped" if current else "Owned"
-                if not WEAPON_DATA[weapon]["infinite"]:
+                if not WEAPON_INFINITE[idx]:
                     line2 = f"Ammo {self.clip[weapon]}/{self.ammo[weapon]}"
                 color = "#ebf4ff"
             else:
-                line2 = f"Buy ${WEAPON_DATA[weapon]['cost']}"
+                line2 = f"Buy ${WEAPON_COST[idx]}"
                 color = "#8d9db2"
 
-            self.canvas.create_text(x + 12, y + 10, anchor="nw", text=f"{idx + 1}. {WEAPON_DATA[weapon]['name']}", fill=color, font=("Consolas", 11, "bold"))
-            self.canvas.create_text(x + 12, y + 31, anchor="nw", text=line2, fill=color, font=("Consolas", 10))
+            append(f"create text {x + 12} {y + 10} -anchor nw -text {{{idx + 1}. {WEAPON_NAME[idx]}}} -fill {color} -font {title_font} -tags wbar")
+            append(f"create text {x + 12} {y + 31} -anchor nw -text {{{line2}}} -fill {color} -font {line_font} -tags wbar")
             x += slot_w + gap
+        self._eval_batch(cmds)
 
     def render_shop_wheel(self) -> None:
         cx = WIDTH // 2
         cy = HALF_HEIGHT
         slot = self.shop_slot_from_mouse()
 
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#060b14", outline="", stipple="gray50")
+        self._draw_overlay("shop")
 
         outer_r = 226
         inner_r = 84
         colors = ["#436283", "#814c4c", "#3d7451", "#7b6a3e"]
 
+        label_font = self._font(12)
+        cmds: list[str] = []
+        append = cmds.append
         for i, weapon in enumerate(WEAPON_ORDER):
             start = i * 90
-            extent = 90
             fill = colors[i]
             if slot == i:
                 fill = "#bca566"
 
-            self.canvas.create_arc(
-                cx - outer_r,
-                cy - outer_r,
-                cx + outer_r,
-                cy + outer_r,
-                start=-start,
-                extent=-extent,
-                fill=fill,
-                outline="#121721",
-                width=3,
-                style=tk.PIESLICE,
+            append(
+                f"create arc {cx - outer_r} {cy - outer_r} {cx + outer_r} {cy + outer_r}"
+                f" -start {-start} -extent -90 -fill {fill} -outline #121721 -width 3 -style pieslice"
             )
 
             mid_angle = math.radians(start + 45)
@@ -3302,23 +4211,23 @@ class FPSBotArena:
 
             owned = self.owned_weapons[weapon]
             if owned:
-                txt = WEAPON_DATA[weapon]["name"]
+                txt = WEAPON_NAME[i]
                 if weapon == self.current_weapon:
                     txt += "\n[EQUIPPED]"
-                elif not WEAPON_DATA[weapon]["infinite"]:
+                elif not WEAPON_INFINITE[i]:
                     txt += f"\nAmmo: {self.clip[weapon]}/{self.ammo[weapon]}"
             else:
-                txt = f"{WEAPON_DATA[weapon]['name']}\n${WEAPON_DATA[weapon]['cost']}"
+                txt = f"{WEAPON_NAME[i]}\n${WEAPON_COST[i]}"
 
-            self.canvas.create_text(tx, ty, text=txt, fill="#f6fbff", font=("Consolas", 12, "bold"), justify="center")
+            append(f"create text {tx} {ty} -text {{{txt}}} -fill #f6fbff -font {label_font} -justify center")
+        self._eval_batch(cmds)
 
         self.canvas.create_oval(cx - inner_r, cy - inner_r, cx + inner_r, cy + inner_r, fill="#101827", outline="#d0deef", width=2)
-        self.canvas.create_text(cx, cy - 12, text="ARMORY", fill="#ffffff", font=("Consolas", 16, "bold"))
-        self.canvas.create_text(cx, cy + 12, text="Click to buy/equip", fill="#d3deed", font=("Consolas", 10))
+        self.canvas.create_text(cx, cy - 12, text="ARMORY", fill="#ffffff", font=self._font(16))
+        self.canvas.create_text(cx, cy + 12, text="Click to buy/equip", fill="#d3deed", font=self._font(10, bold=False))
 
-        focus_index = slot if slot is not None else WEAPON_ORDER.index(self.current_weapon)
+        focus_index = slot if slot is not None else WEAPON_ID[self.current_weapon]
         focus_weapon = WEAPON_ORDER[focus_index]
-        focus_cfg = WEAPON_DATA[focus_weapon]
         panel_w = 340
         panel_h = 96
         px1 = cx - panel_w // 2
@@ -3328,46 +4237,55 @@ class FPSBotArena:
         if py2 < HEIGHT - 12:
             self.draw_ui_panel(px1, py1, px2, py2, fill="#111a28", outline="#7fa3cf")
             owned = self.owned_weapons[focus_weapon]
-            if focus_cfg["infinite"]:
+            if WEAPON_INFINITE[focus_index]:
                 ammo_line = "Ammo: Infinite"
             else:
-                ammo_line = f"Ammo: {self.clip[focus_weapon]}/{self.ammo[focus_weapon]}  Pack +{focus_cfg['ammo_pack']}"
-            status = "Owned" if owned else f"Price: ${focus_cfg['cost']}"
-            self.canvas.create_text(px1 + 14, py1 + 12, anchor="nw", text=f"{focus_cfg['name']}  [{focus_weapon.upper()}]", fill="#eff5ff", font=("Consolas", 12, "bold"))
-            self.canvas.create_text(px1 + 14, py1 + 36, anchor="nw", text=status, fill="#9dd7a9" if owned else "#ffd49b", font=("Consolas", 11, "bold"))
-            self.canvas.create_text(px1 + 14, py1 + 58, anchor="nw", text=ammo_line, fill="#d4e0f0", font=("Consolas", 10))
+                ammo_line = f"Ammo: {self.clip[focus_weapon]}/{self.ammo[focus_weapon]}  Pack +{WEAPON_AMMO_PACK[focus_index]}"
+            status = "Owned" if owned else f"Price: ${WEAPON_COST[focus_index]}"
+            self.canvas.create_text(px1 + 14, py1 + 12, anchor="nw", text=f"{WEAPON_NAME[focus_index]}  [{focus_weapon.upper()}]", fill="#eff5ff", font=self._font(12))
+            self.canvas.create_text(px1 + 14, py1 + 36, anchor="nw", text=status, fill="#9dd7a9" if owned else "#ffd49b", font=self._font(11))
+            self.canvas.create_text(px1 + 14, py1 + 58, anchor="nw", text=ammo_line, fill="#d4e0f0", font=self._font(10, bold=False))
 
     def render_glitch_overlay(self) -> None:
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#091327", outline="", stipple="gray50")
+        self._draw_overlay("glitch")
 
-        for _ in range(18):
-            y = random.randint(0, HEIGHT)
-            offset = random.randint(-80, 80)
-            self.canvas.create_line(0 + offset, y, WIDTH + offset, y + random.randint(-8, 8), fill="#69b6ff", width=2)
+        for y_frac, offset, dy in random.choice(_GLITCH_LINE_PHASES):
+            y = y_frac * HEIGHT
+            self.canvas.create_line(offset, y, WIDTH + offset, y + dy, fill="#69b6ff", width=2)
 
         self.canvas.create_text(
             WIDTH // 2,
             HALF_HEIGHT,
             text="RPG payload destabilized simulation...",
             fill="#cfe6ff",
-            font=("Consolas", 28, "bold"),
+            font=self._font(28),
         )
 
     def render_dead_overlay(self) -> None:
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#2a0000", outline="", stipple="gray50")
-        self.canvas.create_text(WIDTH // 2, HALF_HEIGHT - 24, text="YOU DIED", fill="#ffd5d5", font=("Consolas", 58, "bold"))
-        self.canvas.create_text(
-            WIDTH // 2,
-            HALF_HEIGHT + 34,
-            text="Press R to restart the simulation",
-            fill="#ffe8e8",
-            font=("Consolas", 18),
-        )
-
-    def render_bsod(self, now: float) -> None:
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#0a2ea8", outline="")
+        canvas = self.canvas
+        # Keyed on the overlay image object: update_render_metrics rebuilds
+        # the dim images per resolution and the image item must follow.
+        dead_img = self._overlay_images["dead"]
+        if self._dead_key is not dead_img:
+            self._dead_key = dead_img
+            canvas.delete("deadover")
+            canvas.create_image(0, 0, anchor="nw", image=dead_img, tags="deadover")
+            canvas.create_text(WIDTH // 2, HALF_HEIGHT - 24, text="YOU DIED", fill="#ffd5d5", font=self._font(58), tags="deadover")
+            canvas.create_text(
+                WIDTH // 2,
+                HALF_HEIGHT + 34,
+                text="Press R to restart the simulation",
+                fill="#ffe8e8",
+                font=self._font(18, bold=False),
+                tags="deadover",
+            )
+        if not self._dead_visible:
+            self._dead_visible = True
+            canvas.itemconfigure("deadover", state="normal")
+        canvas.tag_raise("deadover")
 
-        elapsed = now - self.bsod_started_at
+    def _build_bsod(self) -> None:
+        """Build the static BSOD screen once as a persistent item group."""
         lines = [
             "A problem has been detected and Windows has been shut down to prevent damage",
             "to your computer.",
@@ -3384,17 +4302,31 @@ class FPSBotArena:
             "*** STOP: 0x0000FPSC (0xRPG00001, 0x00000002, 0x00000000, 0x00000000)",
         ]
 
+        self.canvas.delete("bsod")
+        line_font = self._font(18, bold=False)
+        cmds = [f"create rectangle 0 0 {WIDTH} {HEIGHT} -fill #0a2ea8 -outline {{}} -tags bsod"]
         y = 84
         for line in lines:
-            self.canvas.create_text(58, y, anchor="nw", text=line, fill="#ffffff", font=("Consolas", 18))
+            cmds.append(f"create text 58 {y} -anchor nw -text {{{line}}} -fill #ffffff -font {line_font} -tags bsod")
             y += 34
+        self._eval_batch(cmds)
 
-        if elapsed > 3.0:
-            self.canvas.create_text(
+    def render_bsod(self, now: float) -> None:
+        canvas = self.canvas
+        if self._bsod_key != (WIDTH, HEIGHT):
+            self._bsod_key = (WIDTH, HEIGHT)
+            self._build_bsod()
+        if not self._bsod_visible:
+            self._bsod_visible = True
+            canvas.itemconfigure("bsod", state="normal")
+        canvas.tag_raise("bsod")
+
+        if now - self.bsod_started_at > 3.0:
+            canvas.create_text(
                 58,
                 HEIGHT - 70,
                 anchor="nw",
                 text="Press R to restart simulation or Esc to quit.",
                 fill="#ffffff",
-                font=("Consolas", 18, "bold"),
+                font=self._font(18),
             )
@@ -52,6 +52,8 @@ WORLD_MAP = [
 
 WEAPON_ORDER = ["pistol", "shotgun", "rifle", "rpg"]
 
+WEAPON_ID = {weapon: index for index, weapon in enumerate(WEAPON_ORDER)}
+
 WEAPON_DATA = {
     "pistol": {
         "name": "Pistol",
@@ -115,6 +117,22 @@ WEAPON_DATA = {
     },
 }
 
+# Flat per-field views of WEAPON_DATA indexed by WEAPON_ID; hot paths pay
+# one tuple subscription instead of two dict lookups per access.
+WEAPON_NAME = tuple(str(WEAPON_DATA[weapon]["name"]) for weapon in WEAPON_ORDER)
+WEAPON_COST = tuple(int(WEAPON_DATA[weapon]["cost"]) for weapon in WEAPON_ORDER)
+WEAPON_AMMO_PACK = tuple(int(WEAPON_DATA[weapon]["ammo_pack"]) for weapon in WEAPON_ORDER)
+WEAPON_MAG_SIZE = tuple(int(WEAPON_DATA[weapon]["mag_size"]) for weapon in WEAPON_ORDER)
+WEAPON_FIRE_RATE = tuple(float(WEAPON_DATA[weapon]["fire_rate"]) for weapon in WEAPON_ORDER)
+WEAPON_DAMAGE = tuple(int(WEAPON_DATA[weapon]["damage"]) for weapon in WEAPON_ORDER)
+WEAPON_SPREAD = tuple(float(WEAPON_DATA[weapon]["spread"]) for weapon in WEAPON_ORDER)
+WEAPON_SPREAD_GROWTH = tuple(float(WEAPON_DATA[weapon]["spread_growth"]) for weapon in WEAPON_ORDER)
+WEAPON_PELLETS = tuple(int(WEAPON_DATA[weapon]["pellets"]) for weapon in WEAPON_ORDER)
+WEAPON_RANGE = tuple(float(WEAPON_DATA[weapon]["range"]) for weapon in WEAPON_ORDER)
+WEAPON_RELOAD_TIME = tuple(float(WEAPON_DATA[weapon]["reload_time"]) for weapon in WEAPON_ORDER)
+WEAPON_RECOIL_SCALE = tuple(float(WEAPON_DATA[weapon]["recoil_scale"]) for weapon in WEAPON_ORDER)
+WEAPON_INFINITE = tuple(bool(WEAPON_DATA[weapon]["infinite"]) for weapon in WEAPON_ORDER)
+
 BOT_ARCHETYPES = {
     "grunt": {
         "hp_mult": 1.0,
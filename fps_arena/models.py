@@ -6,7 +6,25 @@ from dataclasses import dataclass, field
 from .config import WEAPON_DATA, WEAPON_ORDER
 
 
-@dataclass
+class DirtyDict(dict):
+    """Dict that records mutation so serializers can skip unchanged copies.
+
+    Starts dirty so the first snapshot after creation always carries the
+    contents; serializers clear the flag once they have copied it out.
+    """
+
+    __slots__ = ("dirty",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.dirty = True
+
+    def __setitem__(self, key, value) -> None:
+        dict.__setitem__(self, key, value)
+        self.dirty = True
+
+
+@dataclass(slots=True)
 class Bot:
     x: float
     y: float
@@ -17,6 +35,7 @@ class Bot:
     ai_cooldown: float = 0.0
     target_x: float = 0.0
     target_y: float = 0.0
+    target_player_id: str | None = None
     state: str = "advance"
     alive: bool = True
     radius: float = 0.28
@@ -27,7 +46,7 @@ class Bot:
     money_multiplier: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MoneyDrop:
     x: float
     y: float
@@ -35,7 +54,7 @@ class MoneyDrop:
     ttl: float = 24.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RemotePlayer:
     player_id: str
     name: str
@@ -50,7 +69,9 @@ class RemotePlayer:
     clip: dict[str, int] = field(default_factory=lambda: make_clip())
     next_fire_at: float = 0.0
     time_since_damage: float = 0.0
-    keys: set[str] = field(default_factory=set)
+    rtt_ms: float = 22.0
+    next_send_at: float = 0.0
+    keymask: int = 0
     shooting: bool = False
     downed: bool = False
     bleed_out: float = 0.0
@@ -60,7 +81,16 @@ class RemotePlayer:
     headshots: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
+class RemoteInterpTarget:
+    """Latest snapshot pose a teammate view is blending toward."""
+
+    x: float = 0.0
+    y: float = 0.0
+    angle: float = 0.0
+
+
+@dataclass(slots=True)
 class TeammateView:
     player_id: str
     name: str
@@ -91,21 +121,24 @@ class PauseHitbox:
 @dataclass
 class _NetConn:
     sock: socket.socket
-    buffer: str = ""
+    buffer: bytearray = field(default_factory=bytearray)
+    pending: bytearray = field(default_factory=bytearray)
 
 
-def make_owned_weapons() -> dict[str, bool]:
-    return {name: (name == "pistol") for name in WEAPON_ORDER}
+def make_owned_weapons() -> DirtyDict:
+    return DirtyDict({name: (name == "pistol") for name in WEAPON_ORDER})
 
 
-def make_ammo() -> dict[str, int]:
-    return {
-        "pistol": WEAPON_DATA["pistol"]["ammo_pack"],
-        "shotgun": 0,
-        "rifle": 0,
-        "rpg": 0,
-    }
+def make_ammo() -> DirtyDict:
+    return DirtyDict(
+        {
+            "pistol": WEAPON_DATA["pistol"]["ammo_pack"],
+            "shotgun": 0,
+            "rifle": 0,
+            "rpg": 0,
+        }
+    )
 
 
-def make_clip() -> dict[str, int]:
-    return {weapon: int(WEAPON_DATA[weapon]["mag_size"]) for weapon in WEAPON_ORDER}
+def make_clip() -> DirtyDict:
+    return DirtyDict({weapon: int(WEAPON_DATA[weapon]["mag_size"]) for weapon in WEAPON_ORDER})
@@ -2,13 +2,68 @@
 
 import json
 import queue
+import select
 import socket
+import struct
 import threading
-import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import CONNECT_TIMEOUT_SECONDS
 from .models import _NetConn
 
+# Length-prefixed binary framing: a 4-byte big-endian body size followed by
+# a compact JSON body. Avoids scanning the whole receive buffer for newline
+# delimiters and re-decoding it as text on every recv.
+_FRAME_HEADER = struct.Struct("!I")
+
+# A client that falls this many bytes behind is stalled beyond catching up;
+# dropping it beats buffering snapshots without bound.
+_MAX_PENDING_BYTES = 1 << 20
+
+
+if orjson is not None:
+
+    def _encode_body(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_body(body: bytes) -> dict:
+        return orjson.loads(body)
+
+else:
+
+    def _encode_body(payload: dict) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    def _decode_body(body: bytes) -> dict:
+        return json.loads(body)
+
+
+def encode_frame(payload: dict) -> bytes:
+    body = _encode_body(payload)
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+def decode_frames(buffer: bytearray) -> list[dict]:
+    messages: list[dict] = []
+    header_size = _FRAME_HEADER.size
+    while len(buffer) >= header_size:
+        (length,) = _FRAME_HEADER.unpack_from(buffer)
+        end = header_size + length
+        if len(buffer) < end:
+            break
+        try:
+            message = _decode_body(bytes(buffer[header_size:end]))
+        except ValueError:
+            message = None
+        del buffer[:end]
+        if isinstance(message, dict):
+            messages.append(message)
+    return messages
+
 
 class CoopHostServer:
     def __init__(self, host: str, port: int) -> None:
@@ -24,17 +79,56 @@ class CoopHostServer:
         self.running = True
         self.next_player_id = 1
 
+        # Self-pipe so send()/stop() can wake the select() below instead of
+        # the thread sleep-polling on a fixed interval.
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
+    def _wake(self) -> None:
+        try:
+            self._wake_send.send(b"\x00")
+        except OSError:
+            pass
+
     def _send_raw(self, player_id: str, payload: dict) -> None:
         conn = self.clients.get(player_id)
         if conn is None:
             return
+        data = encode_frame(payload)
+        if conn.pending:
+            conn.pending += data
+            if len(conn.pending) > _MAX_PENDING_BYTES:
+                self._disconnect(player_id)
+            return
         try:
-            conn.sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            sent = conn.sock.send(data)
+        except BlockingIOError:
+            sent = 0
         except OSError:
             self._disconnect(player_id)
+            return
+        if sent < len(data):
+            # Kernel buffer full (slow client); keep the tail and let the
+            # select loop drain it when the socket turns writable, instead
+            # of blocking the host or dropping the connection.
+            conn.pending += data[sent:]
+
+    def _flush_pending(self, writable: list) -> None:
+        for player_id, conn in list(self.clients.items()):
+            if not conn.pending or conn.sock not in writable:
+                continue
+            try:
+                sent = conn.sock.send(conn.pending)
+            except BlockingIOError:
+                continue
+            except OSError:
+                self._disconnect(player_id)
+                continue
+            del conn.pending[:sent]
 
     def _disconnect(self, player_id: str) -> None:
         conn = self.clients.pop(player_id, None)
@@ -58,6 +152,10 @@ class CoopHostServer:
             player_id = f"p{self.next_player_id}"
             self.next_player_id += 1
             sock.setblocking(False)
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
             self.clients[player_id] = _NetConn(sock=sock)
             self.incoming.put({"event": "connect", "player_id": player_id})
             self._send_raw(player_id, {"type": "welcome", "player_id": player_id})
@@ -89,24 +187,32 @@ class CoopHostServer:
                 self._disconnect(player_id)
                 continue
 
-            conn.buffer += data.decode("utf-8", errors="ignore")
-            while "\n" in conn.buffer:
-                line, conn.buffer = conn.buffer.split("\n", 1)
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    message = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+            conn.buffer += data
+            for message in decode_frames(conn.buffer):
                 self.incoming.put({"event": "message", "player_id": player_id, "message": message})
 
     def _run(self) -> None:
         while self.running:
-            self._accept_clients()
             self._pump_outgoing()
+
+            watched = [self.server, self._wake_recv]
+            watched.extend(conn.sock for conn in self.clients.values())
+            writers = [conn.sock for conn in self.clients.values() if conn.pending]
+            try:
+                readable, writable, _ = select.select(watched, writers, [], 0.5)
+            except OSError:
+                continue
+
+            if self._wake_recv in readable:
+                try:
+                    self._wake_recv.recv(4096)
+                except OSError:
+                    pass
+            if self.server in readable:
+                self._accept_clients()
+            if writable:
+                self._flush_pending(writable)
             self._pump_incoming()
-            time.sleep(0.01)
 
         for conn in self.clients.values():
             try:
@@ -114,13 +220,15 @@ class CoopHostServer:
             except OSError:
                 pass
         self.clients.clear()
-        try:
-            self.server.close()
-        except OSError:
-            pass
+        for sock in (self.server, self._wake_recv, self._wake_send):
+            try:
+                sock.close()
+            except OSError:
+                pass
 
     def send(self, target: str, payload: dict) -> None:
         self.outgoing.put((target, payload))
+        self._wake()
 
     def poll(self) -> list[dict]:
         events: list[dict] = []
@@ -133,6 +241,7 @@ class CoopHostServer:
 
     def stop(self) -> None:
         self.running = False
+        self._wake()
 
 
 class CoopClient:
@@ -144,17 +253,33 @@ class CoopClient:
         finally:
             self.sock.settimeout(None)
         self.sock.setblocking(False)
+        # Small frames at snapshot rate: without NODELAY, Nagle batches them
+        # behind unacked data and adds up to an RTT of input latency.
+        try:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
 
         self.incoming: queue.Queue[dict] = queue.Queue()
         self.outgoing: queue.Queue[dict] = queue.Queue()
-        self.buffer = ""
+        self.buffer = bytearray()
         self.running = True
 
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
         self.send({"type": "hello", "name": name})
 
+    def _wake(self) -> None:
+        try:
+            self._wake_send.send(b"\x00")
+        except OSError:
+            pass
+
     def _run(self) -> None:
         while self.running:
             while True:
@@ -163,7 +288,7 @@ class CoopClient:
                 except queue.Empty:
                     break
                 try:
-                    self.sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+                    self.sock.sendall(encode_frame(payload))
                 except OSError:
                     self.incoming.put({"event": "disconnect"})
                     self.running = False
@@ -172,10 +297,22 @@ class CoopClient:
             if not self.running:
                 break
 
+            try:
+                readable, _, _ = select.select([self.sock, self._wake_recv], [], [], 0.5)
+            except OSError:
+                continue
+
+            if self._wake_recv in readable:
+                try:
+                    self._wake_recv.recv(4096)
+                except OSError:
+                    pass
+            if self.sock not in readable:
+                continue
+
             try:
                 data = self.sock.recv(65536)
             except BlockingIOError:
-                time.sleep(0.01)
                 continue
             except OSError:
                 self.incoming.put({"event": "disconnect"})
@@ -185,25 +322,19 @@ class CoopClient:
                 self.incoming.put({"event": "disconnect"})
                 break
 
-            self.buffer += data.decode("utf-8", errors="ignore")
-            while "\n" in self.buffer:
-                line, self.buffer = self.buffer.split("\n", 1)
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    message = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+            self.buffer += data
+            for message in decode_frames(self.buffer):
                 self.incoming.put({"event": "message", "message": message})
 
-        try:
-            self.sock.close()
-        except OSError:
-            pass
+        for sock in (self.sock, self._wake_recv, self._wake_send):
+            try:
+                sock.close()
+            except OSError:
+                pass
 
     def send(self, payload: dict) -> None:
         self.outgoing.put(payload)
+        self._wake()
 
     def poll(self) -> list[dict]:
         events: list[dict] = []
@@ -216,3 +347,4 @@ class CoopClient:
 
     def stop(self) -> None:
         self.running = False
+        self._wake()
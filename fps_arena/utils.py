@@ -7,12 +7,16 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     return math.hypot(x2 - x1, y2 - y1)
 
 
+def distance_sq(x1: float, y1: float, x2: float, y2: float) -> float:
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+
 def normalize_angle(angle: float) -> float:
-    while angle < 0:
-        angle += math.tau
-    while angle >= math.tau:
-        angle -= math.tau
-    return angle
+    # Closed-form wrap to [0, tau): constant-time no matter how far the
+    # angle has drifted, unlike the loop-until-in-range version.
+    return angle % math.tau
 
 
 def clamp(value: float, low: float, high: float) -> float: